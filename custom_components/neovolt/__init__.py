@@ -90,7 +90,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_role = new_data.get(CONF_DEVICE_ROLE, DEVICE_ROLE_HOST)
 
     coordinator = NeovoltDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried (ConfigEntryNotReady) or abandoned; either way this
+        # attempt's reference to the shared connection must be dropped, or the
+        # registry never reaches zero and the socket and worker live forever.
+        await hass.async_add_executor_job(coordinator.client.close)
+        raise
 
     # Create device info with device name
     device_info = DeviceInfo(
@@ -95,13 +95,13 @@ class NeovoltStopForceChargeDischargeButton(CoordinatorEntity, ButtonEntity):
                 except Exception as e:
                     _LOGGER.debug(f"Dynamic SOC Export manager not running or already stopped: {e}")
 
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, DISPATCH_RESET_VALUES
-            )
+            await self._client.async_write_registers(0x0880, DISPATCH_RESET_VALUES)
             # Optimistic update - show stopped state immediately
-            self.coordinator.set_optimistic_value("dispatch_start", 0)
-            self.coordinator.set_optimistic_value("dispatch_power", 0)
-            self.coordinator.set_optimistic_value("dispatch_mode", 0)
+            self.coordinator.set_optimistic_values({
+                "dispatch_start": 0,
+                "dispatch_power": 0,
+                "dispatch_mode": 0,
+            })
             self.coordinator.soc_watcher_disarm()
             await self.coordinator.async_request_refresh()
         except Exception as e:
@@ -165,15 +165,9 @@ class NeovoltSyncSystemClockButton(CoordinatorEntity, ButtonEntity):
             # Write each register individually — matches the AlphaESS approach
             # of three separate modbus.write_register calls, ensuring each
             # write is acknowledged before the next one is sent.
-            await self._hass.async_add_executor_job(
-                self._client.write_register, SYSTEM_TIME_YYMM_REGISTER, yymm
-            )
-            await self._hass.async_add_executor_job(
-                self._client.write_register, SYSTEM_TIME_DDHH_REGISTER, ddhh
-            )
-            await self._hass.async_add_executor_job(
-                self._client.write_register, SYSTEM_TIME_MMSS_REGISTER, mmss
-            )
+            await self._client.async_write_register(SYSTEM_TIME_YYMM_REGISTER, yymm)
+            await self._client.async_write_register(SYSTEM_TIME_DDHH_REGISTER, ddhh)
+            await self._client.async_write_register(SYSTEM_TIME_MMSS_REGISTER, mmss)
 
             _LOGGER.info("Inverter system clock synchronised successfully")
 
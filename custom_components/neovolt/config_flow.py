@@ -141,11 +141,16 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         host, port, slave_id
     )
 
-    client = NeovoltModbusClient(host, port, slave_id)
+    # Through the shared registry: when another slave behind the same gateway
+    # is already set up, the probe reuses its socket instead of opening a
+    # second connection the EMS may not accept.
+    client = NeovoltModbusClient.acquire(host, port, slave_id)
 
     # Test connection with detailed error handling
     try:
-        result = await hass.async_add_executor_job(client.test_connection)
+        # The SOC read also proves the slave ID answers, which a bare TCP
+        # connect would not; it runs on the client's own worker.
+        result = await client.async_run(client.test_connection)
         if not result:
             _LOGGER.error("Connection test returned False")
             raise CannotConnect("Connection test failed without specific error")
@@ -164,6 +169,11 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         _LOGGER.error("Unexpected error during connection test: %s", err, exc_info=True)
         raise CannotConnect(f"Unexpected error: {err}") from err
 
+    finally:
+        # Drop the probe's reference; this only closes the socket (and its
+        # worker thread) if no configured entry is using it.
+        await hass.async_add_executor_job(client.close)
+
     # Return info that you want to store in the config entry
     return {"title": f"Neovolt {host}"}
 
@@ -30,10 +30,15 @@ CONF_DYNAMIC_EXPORT_TARGET = "dynamic_export_target"
 DEFAULT_DYNAMIC_EXPORT_TARGET = 0.05  # 50W default — gentle trickle to stay on export side
 DYNAMIC_EXPORT_MIN_POWER = 0.05       # 50W minimum — allows zero-import bias correction
 DYNAMIC_EXPORT_MAX_POWER = 15.0  # 15kW max to support extended system configurations
-DYNAMIC_EXPORT_UPDATE_INTERVAL = 5   # seconds — control loop poll rate, matches grid block pin interval
+DYNAMIC_EXPORT_UPDATE_INTERVAL = 5   # seconds — minimum spacing between control cycles (matches fast poll pin)
 DYNAMIC_EXPORT_SETTLE_SECONDS = 20   # seconds to wait after a command before adjusting again
 DYNAMIC_EXPORT_MAX_STEP_KW = 1.0     # kW — max power change per adjustment step
+DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD = 0.05  # kW — same-direction changes below this are not re-sent (and log at DEBUG)
+DYNAMIC_EXPORT_REWRITE_SECONDS = 60  # seconds — identical dispatch frames are not re-sent within this window
+DYNAMIC_EXPORT_STALE_SECONDS = 60    # seconds — control loop safety-net wakeup if no coordinator update arrives
 DYNAMIC_MODE_FAST_POLL_INTERVAL = 5  # seconds — pinned poll rate for grid+battery blocks during dynamic modes
+DYNAMIC_MODE_STABLE_ERROR_W = 200    # W — grid error below this counts as a steady-state control cycle
+DYNAMIC_MODE_MAX_POLL_MULTIPLIER = 4 # steady-state pin may stretch to this multiple of the fast interval
 
 # SOC (State of Charge) conversion constants
 # FIXED: According to Modbus protocol, dispatch SOC uses full 8-bit range (0-255)
@@ -98,6 +103,7 @@ DEFAULT_POLL_INTERVAL = 30        # starting interval for all blocks
 DEFAULT_CONSECUTIVE_FAILURES = 5
 DEFAULT_STALENESS_THRESHOLD = 10  # minutes
 RECOVERY_COOLDOWN_SECONDS = 60    # cooldown between recovery attempts
+NUMBER_WRITE_DEBOUNCE_SECONDS = 0.25  # rapid slider moves collapse into one Modbus write
 
 # Hard limits for polling configuration
 MIN_POLL_INTERVAL_LIMIT = 5       # Cannot go below 5 seconds
@@ -43,6 +43,11 @@ from .const import (
     COMBINED_BATTERY_DISCHARGE_E,
     STORAGE_DISPATCH_CHARGE_SOC,
     STORAGE_DISPATCH_DISCHARGE_SOC,
+    DISPATCH_MODE_DYNAMIC_EXPORT,
+    DISPATCH_MODE_DYNAMIC_IMPORT,
+    DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
+    DISPATCH_MODE_NO_DISCHARGE,
+    DISPATCH_RESET_VALUES,
 )
 from .modbus_client import NeovoltModbusClient
 
@@ -133,7 +138,7 @@ class AdaptivePollingManager:
         """
         self._pinned_blocks[block_name] = interval
         self.block_intervals[block_name] = interval
-        _LOGGER.debug(f"Pinned block '{block_name}' to {interval}s poll interval")
+        _LOGGER.debug("Pinned block '%s' to %ss poll interval", block_name, interval)
 
     def unpin_block_interval(self, block_name: str) -> None:
         """Release a pinned block back to adaptive control.
@@ -146,8 +151,8 @@ class AdaptivePollingManager:
             del self._pinned_blocks[block_name]
             self.block_intervals[block_name] = self.default_interval
             _LOGGER.debug(
-                f"Unpinned block '{block_name}' -- returned to adaptive control "
-                f"(reset to {self.default_interval}s)"
+                "Unpinned block '%s' -- returned to adaptive control (reset to %ss)",
+                block_name, self.default_interval,
             )
 
     def get_cached_values(self, block_name: str) -> Dict[str, Any]:
@@ -350,9 +355,10 @@ class DispatchSocWatcher:
         if threshold_met:
             if self._state == self.IDLE:
                 _LOGGER.debug(
-                    f"DispatchSocWatcher: threshold met (direction={self._direction}, "
-                    f"soc={soc:.1f}%, target={charge_target if self._direction == 'charge' else discharge_cutoff}%) "
-                    f"— waiting for confirmation on next poll"
+                    "DispatchSocWatcher: threshold met (direction=%s, soc=%.1f%%, target=%s%%) "
+                    "— waiting for confirmation on next poll",
+                    self._direction, soc,
+                    charge_target if self._direction == "charge" else discharge_cutoff,
                 )
                 self._state = self.TRIGGERED
                 return False
@@ -367,8 +373,9 @@ class DispatchSocWatcher:
             # SOC moved away from threshold — reset to IDLE (transient reading guard)
             if self._state == self.TRIGGERED:
                 _LOGGER.debug(
-                    f"DispatchSocWatcher: threshold no longer met "
-                    f"(soc={soc:.1f}%) — resetting to IDLE (transient reading)"
+                    "DispatchSocWatcher: threshold no longer met "
+                    "(soc=%.1f%%) — resetting to IDLE (transient reading)",
+                    soc,
                 )
             self._state = self.IDLE
 
@@ -385,7 +392,9 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         self.port = entry.data[CONF_PORT]
         self.slave_id = entry.data[CONF_SLAVE_ID]
 
-        self.client = NeovoltModbusClient(
+        # Shared per (host, port): a host and follower behind the same
+        # gateway use one TCP connection
+        self.client = NeovoltModbusClient.acquire(
             host=self.host,
             port=self.port,
             slave_id=self.slave_id,
@@ -548,9 +557,23 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
             self.recovery_manager.record_recovery_attempt(now)
 
         try:
-            # Fetch data with adaptive polling
-            data, any_data_changed = await self.hass.async_add_executor_job(
-                self._fetch_data_adaptive, now
+            # Fetch data with adaptive polling. Decide which blocks are due,
+            # then read them with near-adjacent ranges sharing a Modbus
+            # request. Each merged read is its own job on the client's worker,
+            # so a write (e.g. a slider change) made mid-poll goes out after
+            # the read in progress instead of after the whole cycle.
+            due_blocks = {
+                block_name for block_name in REGISTER_BLOCKS
+                if self.polling_manager.should_poll_block(block_name, now)
+            }
+            block_regs = await self.client.async_batch_read([
+                (REGISTER_BLOCKS[block_name].address, REGISTER_BLOCKS[block_name].count)
+                for block_name in due_blocks
+            ]) if due_blocks else {}
+
+            # Parsing and derived values stay off the event loop, on the worker
+            data, any_data_changed = await self.client.async_run(
+                self._fetch_data_adaptive, now, due_blocks, block_regs
             )
 
             # Record success for recovery manager
@@ -607,7 +630,7 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             # Add 30 second timeout to prevent hanging indefinitely
             success = await asyncio.wait_for(
-                self.hass.async_add_executor_job(self.client.force_reconnect),
+                self.client.async_force_reconnect(),
                 timeout=30.0
             )
             if success:
@@ -619,9 +642,12 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error(f"Auto-recovery: error during reconnection: {e}")
 
-    def _fetch_data_adaptive(self, now: datetime) -> tuple[Dict[str, Any], bool]:
+    def _fetch_data_adaptive(
+        self, now: datetime, due_blocks: set[str], block_regs: dict[int, list[int]]
+    ) -> tuple[Dict[str, Any], bool]:
         """
-        Fetch data with adaptive polling per block.
+        Process one adaptive poll: the due blocks and their registers as read
+        by async_batch_read().
 
         Returns:
             Tuple of (data dict, whether any data changed)
@@ -636,9 +662,11 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Process each register block
         for block_name in REGISTER_BLOCKS:
-            if self.polling_manager.should_poll_block(block_name, now):
-                # Poll this block
-                block_data = self._read_block(block_name)
+            if block_name in due_blocks:
+                # Parse this block's freshly read registers
+                block_data = self._parse_block(
+                    block_name, block_regs.get(REGISTER_BLOCKS[block_name].address)
+                )
                 if block_data:
                     # Success - reset failure counter and update polling interval
                     self.polling_manager.reset_block_failures(block_name)
@@ -663,7 +691,7 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
                             f"using cached values"
                         )
                     else:
-                        _LOGGER.debug(f"Block {block_name} read failed, using cached values")
+                        _LOGGER.debug("Block %s read failed, using cached values", block_name)
                     
                     # No data.update() needed - we started with existing cache
             else:
@@ -690,10 +718,12 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         # Calculate derived values
         self._calculate_derived_values(data, successful_reads)
 
-        _LOGGER.debug(
-            f"Adaptive fetch: {len(data)} keys, changed={any_data_changed}, "
-            f"intervals={self._get_interval_summary()}"
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            # The interval summary is built per poll — only when it will be logged.
+            _LOGGER.debug(
+                "Adaptive fetch: %d keys, changed=%s, intervals=%s",
+                len(data), any_data_changed, self._get_interval_summary(),
+            )
 
         return data, any_data_changed
 
@@ -705,13 +735,8 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
             intervals.append(f"{block_name[:3]}:{interval:.0f}s")
         return ", ".join(intervals)
 
-    def _read_block(self, block_name: str) -> Dict[str, Any]:
-        """Read a specific register block and return parsed data."""
-        block = REGISTER_BLOCKS.get(block_name)
-        if not block:
-            return {}
-
-        regs = self.client.read_holding_registers(block.address, block.count)
+    def _parse_block(self, block_name: str, regs: Optional[List[int]]) -> Dict[str, Any]:
+        """Parse a register block read by async_batch_read(); {} if the read failed."""
         if not regs:
             return {}
 
@@ -956,13 +981,6 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         tracking mode constant (98 = Dynamic Import, 99 = Dynamic Export) so the
         select entity keeps reporting the correct option between polls.
         """
-        from .const import (
-            DISPATCH_MODE_DYNAMIC_EXPORT,
-            DISPATCH_MODE_DYNAMIC_IMPORT,
-            DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
-            DISPATCH_MODE_NO_DISCHARGE,
-        )
-
         power_raw = self._to_unsigned_32(regs[1], regs[2])
         time_raw = self._to_unsigned_32(regs[7], regs[8])
         hardware_mode = regs[5]
@@ -1098,7 +1116,7 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
 
             if house_load < 0:
                 _LOGGER.debug(
-                    f"House load negative ({house_load}W) - expected in multi-inverter setups"
+                    "House load negative (%sW) - expected in multi-inverter setups", house_load
                 )
                 data["total_house_load"] = house_load
                 data["excess_grid_export"] = abs(house_load)
@@ -1239,11 +1257,10 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         data[COMBINED_BATTERY_DISCHARGE_E] = round(host_disc_e + foll_disc_e, 2)
 
         _LOGGER.debug(
-            f"Combined values ({'host+follower' if has_follower else 'host only'}): "
-            f"batt_pwr={data.get(COMBINED_BATTERY_POWER)}W, "
-            f"soc={data.get(COMBINED_BATTERY_SOC)}%, "
-            f"house_load={data.get(COMBINED_HOUSE_LOAD)}W, "
-            f"pv={data.get(COMBINED_PV_POWER)}W"
+            "Combined values (%s): batt_pwr=%sW, soc=%s%%, house_load=%sW, pv=%sW",
+            "host+follower" if has_follower else "host only",
+            data.get(COMBINED_BATTERY_POWER), data.get(COMBINED_BATTERY_SOC),
+            data.get(COMBINED_HOUSE_LOAD), data.get(COMBINED_PV_POWER),
         )
 
     def _calculate_daily_pv_energy(self, total_energy: float) -> tuple[float, bool]:
@@ -1485,13 +1502,12 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         try:
-            from .const import DISPATCH_RESET_VALUES
-            await self.hass.async_add_executor_job(
-                self.client.write_registers, 0x0880, DISPATCH_RESET_VALUES
-            )
-            self.set_optimistic_value("dispatch_start", 0)
-            self.set_optimistic_value("dispatch_power", 0)
-            self.set_optimistic_value("dispatch_mode", 0)
+            await self.client.async_write_registers(0x0880, DISPATCH_RESET_VALUES)
+            self.set_optimistic_values({
+                "dispatch_start": 0,
+                "dispatch_power": 0,
+                "dispatch_mode": 0,
+            })
             _LOGGER.info("DispatchSocWatcher: inverter returned to Normal mode")
         except Exception as e:
             _LOGGER.error(f"DispatchSocWatcher: failed to issue stop command: {e}")
@@ -1510,5 +1526,21 @@ class NeovoltDataUpdateCoordinator(DataUpdateCoordinator):
         Updates cache immediately so UI shows expected state before
         next poll confirms actual inverter state. If write failed,
         next poll will correct the cached value automatically.
+
+        The published data snapshot is patched too, so an entity that writes
+        its own state straight away shows the value without forcing a poll.
+        """
+        self._last_known_data[key] = value
+        if self.data is not None:
+            self.data[key] = value
+
+    def set_optimistic_values(self, updates: dict[str, Any]) -> None:
+        """Set several values optimistically in one call.
+
+        Used after a dispatch write, which always updates start/power/mode
+        together. Same semantics as set_optimistic_value: no I/O, the next
+        poll confirms or corrects.
         """
-        self._last_known_data[key] = value
\ No newline at end of file
+        self._last_known_data.update(updates)
+        if self.data is not None:
+            self.data.update(updates)
\ No newline at end of file
@@ -8,14 +8,19 @@ This module manages two continuous dispatch modes:
   DynamicImportManager — charges the battery from the grid to maintain a
       target grid import power level.  Battery power =
       (PV − House Load) + Target Import  (negative = charge).
+
+Both inherit DynamicModeManager, which owns the mode lifecycle and the
+Modbus dispatch writes; each keeps only its own control law.
 """
 import asyncio
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import timedelta
+from typing import Callable, Optional
 
-from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
     CONF_MAX_DISCHARGE_POWER,
@@ -26,11 +31,17 @@ from .const import (
     DISPATCH_MODE_DYNAMIC_IMPORT,
     DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
     DISPATCH_MODE_POWER_WITH_SOC,
+    DISPATCH_RESET_VALUES,
     DYNAMIC_EXPORT_MIN_POWER,
-    DYNAMIC_EXPORT_UPDATE_INTERVAL,
     DYNAMIC_EXPORT_SETTLE_SECONDS,
     DYNAMIC_EXPORT_MAX_STEP_KW,
+    DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD,
+    DYNAMIC_EXPORT_REWRITE_SECONDS,
+    DYNAMIC_EXPORT_STALE_SECONDS,
+    DYNAMIC_EXPORT_UPDATE_INTERVAL,
     DYNAMIC_MODE_FAST_POLL_INTERVAL,
+    DYNAMIC_MODE_MAX_POLL_MULTIPLIER,
+    DYNAMIC_MODE_STABLE_ERROR_W,
     DYNAMIC_SOC_EXPORT_DEFAULT_TARGET_SOC,
     DYNAMIC_SOC_EXPORT_DEFAULT_BUFFER,
     MODBUS_OFFSET,
@@ -41,90 +52,117 @@ from .const import (
     COMBINED_BATTERY_POWER,
     COMBINED_BATTERY_CAPACITY,
     COMBINED_HOUSE_LOAD,
+    DOMAIN,
 )
+# select.py only imports this module lazily (when a mode starts), so a
+# top-level import in this direction cannot be circular.
+from .select import safe_get_by_unique_id, state_to_float
 
 _LOGGER = logging.getLogger(__name__)
 
-# Imported here (not at top-level) to avoid circular import at module load time.
-# Both managers call this at runtime, well after all modules are initialised.
-def _safe_get_by_unique_id(hass: HomeAssistant, unique_id: str, default: float) -> float:
-    """Look up a number entity by unique_id and return its float value.
 
-    Delegates to select.safe_get_by_unique_id which uses the entity registry
-    rather than a generated entity_id string, making it robust to any device
-    naming or slugification the user may have chosen.
+@functools.lru_cache(maxsize=16)
+def soc_percent_to_register(soc_percent: float) -> int:
     """
-    from .select import safe_get_by_unique_id
-    value, _, _ = safe_get_by_unique_id(hass, unique_id, default)
-    return value
-
-
-def _safe_get_by_unique_id_with_source(
-    hass: HomeAssistant, unique_id: str, default: float
-) -> tuple[float, bool, str]:
-    """Look up a number entity by unique_id and return value + fallback metadata.
+    Convert SOC percentage (0-100%) to register value (0-255).
+    
+    FIXED: Uses correct conversion factor and full 0-255 range.
+    Formula: register_value = soc_percent × 2.55
+    Examples: 0% = 0, 50% = 128, 100% = 255
 
-    Returns (value, used_default, reason) so callers can log a warning when a
-    hardcoded default was substituted for a missing or unavailable entity.
-    This is important for dispatch parameters like duration, where silently
-    falling back to 120 min causes the mode to stop earlier than the user set.
+    Memoized: the inputs are the inverter's safety SOC limits, which hold
+    the same handful of values for a whole dispatch run.
     """
-    from .select import safe_get_by_unique_id
-    return safe_get_by_unique_id(hass, unique_id, default)
+    register_value = round(soc_percent * SOC_CONVERSION_FACTOR)
+    # Called on every dispatch write — a single conditional clamp avoids the
+    # nested max()/min() call overhead.
+    if register_value < MIN_SOC_REGISTER:
+        return MIN_SOC_REGISTER
+    return MAX_SOC_REGISTER if register_value > MAX_SOC_REGISTER else register_value
 
 
-def safe_get_entity_float(hass: HomeAssistant, entity_id: str, default: float) -> float:
+def _command_log_level(new_power_kw: float, last_power_kw: float) -> int:
     """
-    Safely retrieve a float value from a Home Assistant entity.
+    Log level for a control-loop command.
 
-    Args:
-        hass: Home Assistant instance
-        entity_id: Entity ID to retrieve
-        default: Default value if entity unavailable or invalid
-
-    Returns:
-        Float value from entity state, or default if unavailable/invalid
+    A steady-state cycle re-sends (almost) the same power every minute; those
+    go to DEBUG so INFO only records meaningful changes in the commanded power.
     """
-    try:
-        entity = hass.states.get(entity_id)
-        if not entity:
-            return default
-
-        state = entity.state
-        if state in ("unknown", "unavailable", "None", None):
-            return default
+    if abs(new_power_kw - last_power_kw) >= DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD:
+        return logging.INFO
+    return logging.DEBUG
 
-        return float(state)
 
-    except (ValueError, TypeError):
-        return default
-    except Exception:
-        return default
-
-
-def soc_percent_to_register(soc_percent: float) -> int:
+def _is_redundant_command(
+    label: str, new_power_kw: float, last_power_kw: float, seconds_since_command: float
+) -> bool:
     """
-    Convert SOC percentage (0-100%) to register value (0-255).
-    
-    FIXED: Uses correct conversion factor and full 0-255 range.
-    Formula: register_value = soc_percent × 2.55
-    Examples: 0% = 0, 50% = 128, 100% = 255
+    True if a new command would not meaningfully change the inverter setpoint.
+
+    A command in the same direction (charge / discharge / standby) as the last
+    one and within DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD of it is not worth an
+    11-register Modbus write. Once the last command is older than
+    DYNAMIC_EXPORT_REWRITE_SECONDS it is sent anyway as a periodic refresh.
     """
-    register_value = round(soc_percent * SOC_CONVERSION_FACTOR)
-    return max(MIN_SOC_REGISTER, min(MAX_SOC_REGISTER, register_value))
+    if seconds_since_command >= DYNAMIC_EXPORT_REWRITE_SECONDS:
+        return False
+    if (new_power_kw > 0) != (last_power_kw > 0) or (new_power_kw < 0) != (last_power_kw < 0):
+        return False
+    if abs(new_power_kw - last_power_kw) >= DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD:
+        return False
+    _LOGGER.debug(
+        "%s: %.2fkW is within %.2fkW of the last command (%.2fkW) — not re-sent",
+        label, new_power_kw, DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD, last_power_kw,
+    )
+    return True
+
+
+# Dispatch frame written to 0x0880 by every dynamic-mode command. Only Para2
+# (power), Para5 (SOC limit) and Para6 (hardware timer) ever vary, and the timer
+# is fixed for a whole mode run, so each manager keeps one buffer with the timer
+# patched in on start() and fills power + SOC in place per command.
+_DISPATCH_FRAME_TEMPLATE = (
+    1,                              # Para1: Dispatch start
+    0,                              # Para2 high byte
+    MODBUS_OFFSET,                  # Para2 low: 32000 + watts (discharge) / − watts (charge)
+    0,                              # Para3 high byte
+    0,                              # Para3 low: Reactive power = 0
+    DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2 (SOC control)
+    0,                              # Para5: SOC cutoff/target (0-255 range)
+    0,                              # Para6 high byte
+    0,                              # Para6 low: Time (seconds) — full duration
+    255,                            # Para7: Energy routing (default)
+    0,                              # Para8: PV switch (auto)
+)
+_FRAME_POWER = 2
+_FRAME_SOC = 6
+_FRAME_TIMEOUT = 8
+# Para5 safety limits: (coordinator key, default %). Discharge and Export
+# standby are bounded by the inverter's discharge floor; charge and Import
+# standby by its charge ceiling.
+_SAFETY_FLOOR = ("discharging_cutoff_soc", 10)
+_SAFETY_CEILING = ("charging_cutoff_soc", 100)
+# Normal-mode reset frame, in the same tuple form _write_dispatch records.
+_RESET_FRAME = tuple(DISPATCH_RESET_VALUES)
 
 
 # ---------------------------------------------------------------------------
-# Dynamic Export Manager
+# Shared dynamic mode machinery
 # ---------------------------------------------------------------------------
 
-class DynamicExportManager:
-    """Manages Dynamic Export mode - continuous adjustment of battery discharge/charge."""
+class DynamicModeManager:
+    """Shared machinery of the closed-loop dynamic dispatch modes.
 
+    Owns the mode lifecycle (start/stop, duration expiry, fast-poll pins), the
+    coordinator-driven wake-ups, the number entity reads and the deduplicated
+    0x0880 dispatch writes. Subclasses supply the direction-specific control
+    law in _update_battery_power().
+    """
+
+    # Mode name used in log messages and the control loop task name.
+    _mode_label = "Dynamic Mode"
     # Internal tracking mode tag stamped onto coordinator data for current_option detection.
-    # Subclasses (e.g. DynamicSOCExportManager) override to distinguish themselves while
-    # reusing the underlying control loop and command builders.
-    _dispatch_mode_tag = DISPATCH_MODE_DYNAMIC_EXPORT
+    _dispatch_mode_tag: int
 
     def __init__(
         self,
@@ -133,7 +171,7 @@ class DynamicExportManager:
         client,
         device_name: str,
     ):
-        """Initialize the Dynamic Export Manager.
+        """Initialize the dynamic mode manager.
 
         Args:
             hass: Home Assistant instance
@@ -142,20 +180,58 @@ class DynamicExportManager:
             device_name: Device name for entity ID generation
         """
         self._hass = hass
+        self._loop = hass.loop
         self._coordinator = coordinator
         self._client = client
         self._device_name = device_name
         self._running = False
+        # unique_ids of the number entities read every cycle, built once here
+        # rather than as f-strings per cycle. Their entity_ids are resolved via
+        # the entity registry on first use and cached until the next start().
+        self._uid_duration = f"neovolt_{device_name}_dispatch_duration"
+        self._uid_power_target = f"neovolt_{device_name}_dynamic_mode_power_target"
+        self._states_get = hass.states.get
+        self._entity_ids: dict[str, str] = {}
+        # entity_id → (State, parsed float). HA replaces the State object on
+        # every change, so an identity match means the cached float is current.
+        self._parsed_states: dict[str, tuple[object, float]] = {}
+        self._poll_interval: float = DYNAMIC_MODE_FAST_POLL_INTERVAL
         self._task: Optional[asyncio.Task] = None
-        self._last_update_time: Optional[datetime] = None
-        self._last_grid_power_w: Optional[float] = None  # Last grid reading used for debounce
+        # Set by a coordinator listener whenever fresh data lands, so the loop
+        # only recomputes when its inputs (grid/battery readings) have changed.
+        self._data_event = asyncio.Event()
+        self._unsub_coordinator: Optional[Callable[[], None]] = None
+        # Listener wake-ups are rate-limited to one per
+        # DYNAMIC_EXPORT_UPDATE_INTERVAL; a burst is deferred, never dropped.
+        self._last_wake_mono: float = float("-inf")
+        self._deferred_wake: Optional[asyncio.TimerHandle] = None
+        # One-shot timer that ends the mode when the user-set duration elapses
+        self._unsub_expiry: Optional[Callable[[], None]] = None
+        self._unsub_safety_tick: Optional[Callable[[], None]] = None
+        # Timing uses the event loop's monotonic clock (loop.time()) — only
+        # deltas are needed, and wall-clock jumps must not stretch or shorten
+        # the settle timer or the mode duration.
+        self._last_update_mono: Optional[float] = None
+        self._last_inputs: Optional[tuple] = None        # Inputs behind the last command (debounce)
         self._last_commanded_power_kw: float = 0.0       # Last power sent — used for slew limiting
-        self._start_time: Optional[datetime] = None
+        self._deadline_mono: Optional[float] = None  # loop.time() at which the mode ends
         self._duration_minutes: Optional[int] = None
         # Hardware timer written to Para6 on every command — set to the full
         # user-configured duration on start() so the inverter cannot self-reset
         # between HA update cycles even if several cycles are missed.
         self._timeout_seconds: int = 600
+        # Preallocated dispatch frame, mutated in place per command. Only the
+        # control loop task builds frames and it awaits each write before the
+        # next, so the buffer is never modified while a write is in flight.
+        self._tx_frame = list(_DISPATCH_FRAME_TEMPLATE)
+        self._tx_frame[_FRAME_TIMEOUT] = self._timeout_seconds
+        # Serialises dispatch frames so a reset racing a pending update cannot
+        # interleave with it on the wire.
+        self._write_lock = asyncio.Lock()
+        # Last dispatch frame successfully written and when — identical frames
+        # inside DYNAMIC_EXPORT_REWRITE_SECONDS are skipped by _write_dispatch().
+        self._last_frame: Optional[tuple] = None
+        self._last_frame_mono: float = 0.0
 
         # Get max charge/discharge power directly from the coordinator's own config
         # entry — this is always correct and avoids the previous name-matching loop
@@ -170,120 +246,407 @@ class DynamicExportManager:
         )
 
         _LOGGER.info(
-            f"Initialized Dynamic Export Manager for {device_name} "
-            f"(max discharge: {self._max_discharge_power}kW, "
-            f"max charge: {self._max_charge_power}kW)"
+            "Initialized %s Manager for %s (max discharge: %skW, max charge: %skW)",
+            self._mode_label, device_name, self._max_discharge_power, self._max_charge_power,
         )
 
     @property
     def is_running(self) -> bool:
-        """Check if Dynamic Export mode is currently active."""
+        """Check if the mode is currently active."""
         return self._running
 
+    @property
+    def remaining_seconds(self) -> Optional[float]:
+        """Seconds left before the mode auto-stops, or None when not running."""
+        if not self._running or self._deadline_mono is None:
+            return None
+        return max(0.0, self._deadline_mono - self._loop.time())
+
     async def start(self) -> None:
-        """Start the Dynamic Export control loop."""
+        """Start the control loop."""
         if self._running:
-            _LOGGER.warning("Dynamic Export already running")
+            _LOGGER.warning("%s already running", self._mode_label)
             return
 
         # Get duration from number entity (unique_id lookup — robust to device naming)
-        _duration, duration_default, duration_reason = _safe_get_by_unique_id_with_source(
+        # (value, used_default, reason): the fallback is logged below, since a
+        # silent 120 min default would stop the mode earlier than the user set.
+        _duration, duration_default, duration_reason = safe_get_by_unique_id(
             self._hass,
-            f"neovolt_{self._device_name}_dispatch_duration",
+            self._uid_duration,
             120.0,
         )
         duration_minutes = int(_duration)
         if duration_default:
             _LOGGER.warning(
-                f"Dynamic Export is using fallback duration={duration_minutes}min "
-                f"({duration_reason}). The dispatch_duration entity was not available "
-                f"at start time — mode will stop after {duration_minutes} minutes "
-                f"instead of the configured value. "
-                f"To avoid this, ensure all Dispatch number entities are loaded "
-                f"before starting Dynamic Export."
+                "%s is using fallback duration=%smin (%s). The dispatch_duration "
+                "entity was not available at start time — mode will stop after %s "
+                "minutes instead of the configured value. To avoid this, ensure all "
+                "Dispatch number entities are loaded before starting %s.",
+                self._mode_label, duration_minutes, duration_reason, duration_minutes,
+                self._mode_label,
             )
 
-        _LOGGER.info(f"Starting Dynamic Export mode (duration: {duration_minutes} minutes)")
+        _LOGGER.info("Starting %s mode (duration: %s minutes)", self._mode_label, duration_minutes)
         self._running = True
-        self._last_update_time = None
-        self._last_grid_power_w = None
+        self._entity_ids.clear()
+        self._parsed_states.clear()
+        self._last_update_mono = None
+        self._last_inputs = None
         self._last_commanded_power_kw = 0.0
-        self._start_time = dt_util.now()
+        self._last_frame = None
         self._duration_minutes = duration_minutes
+        self._deadline_mono = self._loop.time() + duration_minutes * 60
         # Set hardware timer to full duration so the inverter cannot self-reset
         # between HA update cycles even if several consecutive cycles are missed.
         self._timeout_seconds = min(duration_minutes * 60, 65535)
+        self._tx_frame[_FRAME_TIMEOUT] = self._timeout_seconds
 
         # Pin grid and battery blocks to fast poll rate for the duration of this mode
+        self._poll_interval = DYNAMIC_MODE_FAST_POLL_INTERVAL
         self._coordinator.polling_manager.pin_block_interval("grid", DYNAMIC_MODE_FAST_POLL_INTERVAL)
         self._coordinator.polling_manager.pin_block_interval("battery", DYNAMIC_MODE_FAST_POLL_INTERVAL)
         _LOGGER.info(
-            f"Dynamic Export: pinned grid+battery blocks to {DYNAMIC_MODE_FAST_POLL_INTERVAL}s poll interval"
+            "%s: pinned grid+battery blocks to %ss poll interval",
+            self._mode_label, DYNAMIC_MODE_FAST_POLL_INTERVAL,
+        )
+
+        # Wake the control loop on each coordinator refresh
+        self._data_event.clear()
+        self._last_wake_mono = float("-inf")
+        self._unsub_coordinator = self._coordinator.async_add_listener(self._on_coordinator_update)
+
+        # Duration expiry is a single scheduled callback rather than a check on
+        # every loop iteration.
+        self._unsub_expiry = async_call_later(
+            self._hass, duration_minutes * 60, self._async_duration_expired
+        )
+        # Safety net: re-evaluate even if coordinator polling stalls.
+        self._unsub_safety_tick = async_track_time_interval(
+            self._hass, self._async_safety_tick,
+            timedelta(seconds=DYNAMIC_EXPORT_STALE_SECONDS),
         )
 
-        # Start the control loop as a background task
+        # Start the control loop as a background task. It runs for the whole
+        # mode duration, so it must not be a tracked task (HA waits on those
+        # during startup/shutdown); eager_start runs it up to its first await
+        # immediately instead of a loop iteration later.
         try:
-            self._task = self._hass.async_create_task(self._control_loop())
-            _LOGGER.info("Dynamic Export control loop task created successfully")
+            self._task = self._hass.async_create_background_task(
+                self._control_loop(),
+                name=f"{DOMAIN}_{self._mode_label.lower().replace(' ', '_')}_{self._device_name}",
+                eager_start=True,
+            )
+            _LOGGER.info("%s control loop task created successfully", self._mode_label)
         except Exception as e:
-            _LOGGER.error(f"Failed to create Dynamic Export task: {e}", exc_info=True)
+            _LOGGER.error("Failed to create %s task: %s", self._mode_label, e, exc_info=True)
             self._running = False
             raise
 
     async def stop(self) -> None:
-        """Stop the Dynamic Export control loop."""
+        """Stop the control loop."""
         if not self._running:
             return
 
-        _LOGGER.info("Stopping Dynamic Export mode")
+        _LOGGER.info("Stopping %s mode", self._mode_label)
         self._running = False
 
         # Release the fast-poll pin so grid+battery return to adaptive control
         self._coordinator.polling_manager.unpin_block_interval("grid")
         self._coordinator.polling_manager.unpin_block_interval("battery")
-        _LOGGER.info("Dynamic Export: released grid+battery poll interval pins")
+        _LOGGER.info("%s: released grid+battery poll interval pins", self._mode_label)
+
+        if self._unsub_coordinator:
+            self._unsub_coordinator()
+            self._unsub_coordinator = None
+        if self._deferred_wake:
+            self._deferred_wake.cancel()
+            self._deferred_wake = None
+        if self._unsub_expiry:
+            self._unsub_expiry()
+            self._unsub_expiry = None
+        if self._unsub_safety_tick:
+            self._unsub_safety_tick()
+            self._unsub_safety_tick = None
 
         if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            # Wake the loop rather than cancelling it: it sees _running is False
+            # and returns on its own, finishing any in-flight cycle cleanly.
+            self._data_event.set()
+            await asyncio.wait([self._task])
             self._task = None
 
     async def _control_loop(self) -> None:
-        """Main control loop for Dynamic Export mode."""
-        _LOGGER.info("Dynamic Export control loop started")
+        """Main control loop: one control cycle per coordinator wake-up."""
+        _LOGGER.info("%s control loop started", self._mode_label)
         
         try:
             while self._running:
-                # Check if duration has expired
-                if self._start_time and self._duration_minutes:
-                    elapsed = (dt_util.now() - self._start_time).total_seconds() / 60.0
-                    if elapsed >= self._duration_minutes:
-                        _LOGGER.info(
-                            f"Dynamic Export duration expired ({self._duration_minutes} minutes). "
-                            "Stopping automatically."
-                        )
-                        await self._stop_and_reset_dispatch()
-                        break
-                
                 try:
-                    _LOGGER.debug("Dynamic Export: Running update cycle")
+                    _LOGGER.debug("%s: Running update cycle", self._mode_label)
                     await self._update_battery_power()
                 except Exception as e:
-                    _LOGGER.error(f"Error in Dynamic Export control loop: {e}", exc_info=True)
+                    _LOGGER.error("Error in %s control loop: %s", self._mode_label, e, exc_info=True)
+
+                await self._wait_for_data()
+
+            _LOGGER.info("%s control loop stopped", self._mode_label)
 
-                # Wait for next update interval
-                await asyncio.sleep(DYNAMIC_EXPORT_UPDATE_INTERVAL)
-                
         except asyncio.CancelledError:
-            _LOGGER.info("Dynamic Export control loop cancelled")
+            _LOGGER.info("%s control loop cancelled", self._mode_label)
             raise
         except Exception as e:
-            _LOGGER.error(f"Unexpected error in Dynamic Export control loop: {e}", exc_info=True)
+            _LOGGER.error("Unexpected error in %s control loop: %s", self._mode_label, e, exc_info=True)
             self._running = False
 
+    async def _wait_for_data(self) -> None:
+        """Block until the coordinator delivers fresh data.
+
+        Recomputing on a fixed timer re-ran the calculation against unchanged
+        readings between polls. Waking on the coordinator listener instead
+        aligns each cycle with new grid data; a DYNAMIC_EXPORT_STALE_SECONDS
+        interval on HA's scheduler (_async_safety_tick) is a safety net so the
+        loop still re-evaluates if polling stalls — cheaper than arming a
+        wait_for() timeout on every cycle. stop() also sets the event so the
+        loop exits without waiting.
+        """
+        await self._data_event.wait()
+        self._data_event.clear()
+        self._last_wake_mono = self._loop.time()
+
+    @callback
+    def _async_safety_tick(self, _now) -> None:
+        """Wake the control loop when no coordinator update has arrived."""
+        self._data_event.set()
+
+    @callback
+    def _on_coordinator_update(self) -> None:
+        """Coordinator listener: wake the loop at most once per update interval.
+
+        Extra refreshes (async_request_refresh after a number or button change
+        landing next to a scheduled poll) would otherwise each cost a full
+        control cycle. An early one is deferred to the end of the interval,
+        so the latest data is still evaluated, just not more often.
+        """
+        if self._deferred_wake is not None:
+            return
+        due = self._last_wake_mono + DYNAMIC_EXPORT_UPDATE_INTERVAL
+        if self._loop.time() >= due:
+            self._data_event.set()
+        else:
+            self._deferred_wake = self._loop.call_at(due, self._fire_deferred_wake)
+
+    @callback
+    def _fire_deferred_wake(self) -> None:
+        """Deliver a wake-up held back by _on_coordinator_update."""
+        self._deferred_wake = None
+        self._data_event.set()
+
+    async def _update_battery_power(self) -> None:
+        """Run one control cycle; implemented by each mode's control law."""
+        raise NotImplementedError
+
+    def _adapt_poll_interval(self, grid_error_w: float) -> None:
+        """Stretch the grid+battery poll pin while the loop sits on target.
+
+        Every evaluated cycle with |grid error| below DYNAMIC_MODE_STABLE_ERROR_W
+        doubles the pinned interval, up to DYNAMIC_MODE_MAX_POLL_MULTIPLIER times
+        the fast rate, so a settled system costs fewer Modbus reads and control
+        wake-ups. Any larger error snaps straight back to the fast rate.
+        """
+        if abs(grid_error_w) < DYNAMIC_MODE_STABLE_ERROR_W:
+            interval = min(
+                self._poll_interval * 2,
+                DYNAMIC_MODE_FAST_POLL_INTERVAL * DYNAMIC_MODE_MAX_POLL_MULTIPLIER,
+            )
+        else:
+            interval = DYNAMIC_MODE_FAST_POLL_INTERVAL
+        if interval == self._poll_interval:
+            return
+        self._poll_interval = interval
+        self._coordinator.polling_manager.pin_block_interval("grid", interval)
+        self._coordinator.polling_manager.pin_block_interval("battery", interval)
+        _LOGGER.debug(
+            "%s: grid error %.0fW — grid+battery poll pin now %ss",
+            self._mode_label, grid_error_w, interval,
+        )
+
+    def _get_number(self, unique_id: str, default: float) -> float:
+        """Return a number entity's value, resolving its entity_id only once.
+
+        The unique_id → entity_id registry lookup is cached per mode run, and
+        the parsed float is reused for as long as hass.states.get() returns the
+        same State object, so a steady-state cycle is one dict lookup.
+        """
+        entity_id = self._entity_ids.get(unique_id)
+        if entity_id is None:
+            entity_id = async_get_entity_registry(self._hass).async_get_entity_id(
+                "number", DOMAIN, unique_id
+            )
+            if entity_id is None:
+                _LOGGER.debug(
+                    "unique_id '%s' not found in entity registry, using default: %s",
+                    unique_id, default,
+                )
+                return default
+            self._entity_ids[unique_id] = entity_id
+
+        state_obj = self._states_get(entity_id)
+        cached = self._parsed_states.get(entity_id)
+        if cached is not None and cached[0] is state_obj:
+            return cached[1]
+        value = state_to_float(state_obj, default)
+        if state_obj is not None:
+            self._parsed_states[entity_id] = (state_obj, value)
+        return value
+
+    async def _send_power_command(self, signed_watts: int, safety_soc: tuple[str, int]) -> bool:
+        """Send a dispatch command to the inverter.
+
+        signed_watts: positive discharges, negative charges, zero holds the
+        mode active in standby. Para5 is only the inverter's own safety limit
+        named by safety_soc (_SAFETY_FLOOR / _SAFETY_CEILING); the user's
+        dispatch SOC target is managed by DispatchSocWatcher in HA.
+
+        Returns whether the inverter holds the command (see _write_dispatch).
+        The control loop only records a command as sent when it does, so a
+        failed write is retried on the next cycle instead of being debounced.
+        """
+        data = self._coordinator.data
+        soc_key, soc_default = safety_soc
+        soc_value = soc_percent_to_register(data.get(soc_key, soc_default) if data else soc_default)
+
+        values = self._build_frame(MODBUS_OFFSET + signed_watts, soc_value)
+
+        try:
+            written = await self._write_dispatch(values)
+            if written:
+                # Update coordinator with optimistic values
+                self._coordinator.set_optimistic_values({
+                    "dispatch_start": 1,
+                    "dispatch_power": signed_watts,
+                    "dispatch_mode": self._dispatch_mode_tag,
+                })
+
+        except Exception as e:
+            _LOGGER.error(
+                "Failed to send %s command (%+dW): %s", self._mode_label, signed_watts, e
+            )
+            raise
+        return written
+
+    def _build_frame(self, power_register: int, soc_value: int) -> list:
+        """Fill Para2 power and Para5 SOC into the preallocated frame and return it."""
+        frame = self._tx_frame
+        frame[_FRAME_POWER] = power_register
+        frame[_FRAME_SOC] = soc_value
+        return frame
+
+    async def _write_dispatch(self, values: list, dedupe: bool = True) -> bool:
+        """Write an 11-register dispatch frame to 0x0880.
+
+        A frame identical to the last one written less than
+        DYNAMIC_EXPORT_REWRITE_SECONDS ago is skipped — the inverter already
+        holds that command and its Para6 timer covers the whole mode duration.
+        Pass dedupe=False for frames that must always reach the wire (reset).
+
+        The executor job is shielded so that cancelling the control loop task
+        (e.g. at Home Assistant shutdown) cannot abandon a frame mid-transaction
+        and leave the pymodbus socket desynchronised. If cancellation does
+        arrive, the lock is held until the frame is on the wire before the
+        CancelledError is re-raised.
+
+        Returns True when the inverter holds the frame (written now, or an
+        unchanged frame skipped by the dedupe), False when it was dropped or
+        the write failed.
+        """
+        # The tuple snapshot is both the dedupe key and what goes on the wire:
+        # the caller's preallocated buffer may be rebuilt by the next cycle
+        # while this write is still queued on the Modbus executor.
+        frame = tuple(values)
+        async with self._write_lock:
+            if dedupe and not self._running:
+                # stop() arrived while this cycle was computing — drop the
+                # command rather than re-arm dispatch behind the caller's back.
+                return False
+
+            now = self._loop.time()
+            if (
+                dedupe
+                and frame == self._last_frame
+                and now - self._last_frame_mono < DYNAMIC_EXPORT_REWRITE_SECONDS
+            ):
+                _LOGGER.debug(
+                    "%s: dispatch frame unchanged (%.0fs old) — skipping Modbus write",
+                    self._mode_label, now - self._last_frame_mono,
+                )
+                return True
+
+            write = self._client.async_write_registers(0x0880, frame)
+            try:
+                ok = await asyncio.shield(write)
+            except asyncio.CancelledError:
+                await asyncio.wait([write])
+                raise
+
+            # Only remember frames that actually reached the inverter, otherwise
+            # a failed write would suppress its own retry on the next cycle.
+            if ok:
+                self._last_frame = frame
+                self._last_frame_mono = now
+            else:
+                self._last_frame = None
+            return bool(ok)
+
+    async def _async_duration_expired(self, _now) -> None:
+        """Timer callback: the configured duration has elapsed."""
+        self._unsub_expiry = None
+        if not self._running:
+            return
+        _LOGGER.info(
+            "%s duration expired (%s minutes). Stopping automatically.",
+            self._mode_label, self._duration_minutes,
+        )
+        await self._stop_and_reset_dispatch()
+
+    async def _stop_and_reset_dispatch(self) -> None:
+        """Stop dispatch, reset to Normal mode, and exit the mode."""
+        _LOGGER.info("%s: resetting to Normal mode", self._mode_label)
+
+        # Stop the control loop first: stop() waits for any in-flight command
+        # frame to finish, so nothing can reach the inverter after the reset.
+        await self.stop()
+
+        if self._last_frame == _RESET_FRAME:
+            # The inverter already holds the reset from an earlier stop.
+            _LOGGER.debug("%s: dispatch already reset — skipping Modbus write", self._mode_label)
+            return
+
+        try:
+            if await self._write_dispatch(DISPATCH_RESET_VALUES, dedupe=False):
+                # Update coordinator
+                self._coordinator.set_optimistic_values({
+                    "dispatch_start": 0,
+                    "dispatch_power": 0,
+                    "dispatch_mode": 0,
+                })
+
+        except Exception as e:
+            _LOGGER.error("Failed to stop %s dispatch: %s", self._mode_label, e)
+
+
+# ---------------------------------------------------------------------------
+# Dynamic Export Manager
+# ---------------------------------------------------------------------------
+
+class DynamicExportManager(DynamicModeManager):
+    """Manages Dynamic Export mode - continuous adjustment of battery discharge/charge."""
+
+    _mode_label = "Dynamic Export"
+    # Subclasses (e.g. DynamicSOCExportManager) override the tag to distinguish
+    # themselves while reusing the underlying control loop and command builders.
+    _dispatch_mode_tag = DISPATCH_MODE_DYNAMIC_EXPORT
+
     async def _update_battery_power(self) -> None:
         """
         Calculate required battery power and send appropriate command.
@@ -310,6 +673,9 @@ class DynamicExportManager:
         This prevents the closed-loop from oscillating: once a command is sent and
         the battery responds, the grid reading stabilises near target and subsequent
         cycles correctly see only a small change and skip redundant commands.
+        A resulting command within DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD of the last
+        one (same direction) is not written at all until it is
+        DYNAMIC_EXPORT_REWRITE_SECONDS old.
         """
         data = self._coordinator.data
 
@@ -317,13 +683,6 @@ class DynamicExportManager:
         # this dynamically (e.g. SOC-paced smooth rate). Base class reads the entity.
         target_export_kw = self._get_target_export_kw()
 
-        # Get discharge SOC cutoff (unique_id lookup — robust to device naming)
-        soc_cutoff = int(_safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dispatch_discharge_soc",
-            10.0,
-        ))
-
         # ── Grid power (signed, W) ────────────────────────────────────────────
         # Authoritative system-wide net power — incorporates all inverters,
         # all house loads and all PV without needing to read them individually.
@@ -332,6 +691,19 @@ class DynamicExportManager:
             _LOGGER.warning("Cannot calculate Dynamic Export — grid_power_total unavailable")
             return
 
+        # ── Unchanged inputs ──────────────────────────────────────────────────
+        # If the readings and target are exactly those behind the last command,
+        # the meter has not reported anything new — recomputing would at best
+        # repeat that command and, for Method B, apply the same error twice.
+        # After DYNAMIC_EXPORT_STALE_SECONDS the cycle runs anyway.
+        combined_battery_w = data.get(COMBINED_BATTERY_POWER)
+        inputs = (grid_power_w, combined_battery_w, target_export_kw)
+        if (
+            inputs == self._last_inputs
+            and self._loop.time() - self._last_update_mono < DYNAMIC_EXPORT_STALE_SECONDS
+        ):
+            return
+
         # ── Core calculation ──────────────────────────────────────────────────
         # Two methods depending on whether follower battery data is available:
         #
@@ -354,9 +726,9 @@ class DynamicExportManager:
         target_export_w = target_export_kw * 1000
         grid_error_w = grid_power_w + target_export_w
         grid_error_kw = grid_error_w / 1000.0
+        self._adapt_poll_interval(grid_error_w)
         current_export_w = -grid_power_w
 
-        combined_battery_w = data.get(COMBINED_BATTERY_POWER)
         has_follower = (
             self._coordinator.follower_coordinator is not None
             and bool(self._coordinator.follower_coordinator.data)
@@ -365,20 +737,22 @@ class DynamicExportManager:
             # Method A: follower data available — use actual battery power as baseline
             battery_power_needed_kw = (combined_battery_w + grid_error_w) / 1000.0
             _LOGGER.debug(
-                f"Dynamic Export [Method A — host+follower]: "
-                f"Target={target_export_w:.0f}W, Grid={grid_power_w:.0f}W, "
-                f"GridError={grid_error_w:.0f}W, CombinedBattery={combined_battery_w:.0f}W, "
-                f"BatteryNeeded={battery_power_needed_kw:.2f}kW"
+                "Dynamic Export [Method A — host+follower]: "
+                "Target=%.0fW, Grid=%.0fW, GridError=%.0fW, CombinedBattery=%.0fW, "
+                "BatteryNeeded=%.2fkW",
+                target_export_w, grid_power_w, grid_error_w, combined_battery_w,
+                battery_power_needed_kw,
             )
         else:
             # Method B: host only — step from last commanded power
             delta_kw = max(-DYNAMIC_EXPORT_MAX_STEP_KW, min(DYNAMIC_EXPORT_MAX_STEP_KW, grid_error_kw))
             battery_power_needed_kw = self._last_commanded_power_kw + delta_kw
             _LOGGER.debug(
-                f"Dynamic Export [Method B — host only]: "
-                f"Target={target_export_w:.0f}W, Grid={grid_power_w:.0f}W, "
-                f"GridError={grid_error_w:.0f}W, LastCmd={self._last_commanded_power_kw:.2f}kW, "
-                f"Delta={delta_kw:.2f}kW, BatteryNeeded={battery_power_needed_kw:.2f}kW"
+                "Dynamic Export [Method B — host only]: "
+                "Target=%.0fW, Grid=%.0fW, GridError=%.0fW, LastCmd=%.2fkW, "
+                "Delta=%.2fkW, BatteryNeeded=%.2fkW",
+                target_export_w, grid_power_w, grid_error_w, self._last_commanded_power_kw,
+                delta_kw, battery_power_needed_kw,
             )
 
         # ── Settle timer ─────────────────────────────────────────────────────
@@ -386,53 +760,78 @@ class DynamicExportManager:
         # adjusting again. This gives the inverter time to actually ramp to the
         # commanded power and the grid meter time to reflect the change, preventing
         # the staircase oscillation caused by re-commanding before the hardware responds.
-        now = dt_util.now()
+        now = self._loop.time()
         seconds_since_command = (
-            (now - self._last_update_time).total_seconds()
-            if self._last_update_time else float("inf")
+            now - self._last_update_mono
+            if self._last_update_mono is not None else float("inf")
         )
 
         if seconds_since_command < DYNAMIC_EXPORT_SETTLE_SECONDS:
             _LOGGER.debug(
-                f"Dynamic Export: Waiting for inverter to settle — "
-                f"{seconds_since_command:.0f}s since last command "
-                f"(settle period={DYNAMIC_EXPORT_SETTLE_SECONDS}s), "
-                f"current grid={grid_power_w/1000:.2f}kW"
+                "Dynamic Export: Waiting for inverter to settle — "
+                "%.0fs since last command (settle period=%ss), current grid=%.2fkW",
+                seconds_since_command, DYNAMIC_EXPORT_SETTLE_SECONDS, grid_power_w / 1000,
             )
             return
 
         # ── Send command ──────────────────────────────────────────────────────
+        # Each branch is only entered above DYNAMIC_EXPORT_MIN_POWER and the
+        # configured max powers are validated to be >= MIN_POWER (same 50 W),
+        # so clamping to the max is the only bound that can apply.
         if battery_power_needed_kw > DYNAMIC_EXPORT_MIN_POWER:
-            discharge_power_kw = min(battery_power_needed_kw, self._max_discharge_power)
-            discharge_power_kw = max(discharge_power_kw, DYNAMIC_EXPORT_MIN_POWER)
-            _LOGGER.info(
-                f"Dynamic Export: Discharging battery at {discharge_power_kw:.2f}kW "
-                f"(Grid={grid_power_w/1000:.2f}kW, Export={current_export_w/1000:.2f}kW, "
-                f"Target={target_export_kw:.2f}kW)"
+            discharge_power_kw = battery_power_needed_kw
+            if discharge_power_kw > self._max_discharge_power:
+                discharge_power_kw = self._max_discharge_power
+            if _is_redundant_command(
+                "Dynamic Export", discharge_power_kw, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(discharge_power_kw, self._last_commanded_power_kw),
+                "Dynamic Export: Discharging battery at %.2fkW "
+                "(Grid=%.2fkW, Export=%.2fkW, Target=%.2fkW)",
+                discharge_power_kw, grid_power_w / 1000, current_export_w / 1000,
+                target_export_kw,
             )
-            await self._send_discharge_command(discharge_power_kw, soc_cutoff)
+            if not await self._send_power_command(int(discharge_power_kw * 1000), _SAFETY_FLOOR):
+                return
             self._last_commanded_power_kw = discharge_power_kw
 
         elif battery_power_needed_kw < -DYNAMIC_EXPORT_MIN_POWER:
-            charge_power_kw = min(abs(battery_power_needed_kw), self._max_charge_power)
-            charge_power_kw = max(charge_power_kw, DYNAMIC_EXPORT_MIN_POWER)
-            _LOGGER.info(
-                f"Dynamic Export: Charging battery at {charge_power_kw:.2f}kW to absorb excess "
-                f"(Grid={grid_power_w/1000:.2f}kW, Export={current_export_w/1000:.2f}kW, "
-                f"Target={target_export_kw:.2f}kW)"
+            charge_power_kw = -battery_power_needed_kw
+            if charge_power_kw > self._max_charge_power:
+                charge_power_kw = self._max_charge_power
+            if _is_redundant_command(
+                "Dynamic Export", -charge_power_kw, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(-charge_power_kw, self._last_commanded_power_kw),
+                "Dynamic Export: Charging battery at %.2fkW to absorb excess "
+                "(Grid=%.2fkW, Export=%.2fkW, Target=%.2fkW)",
+                charge_power_kw, grid_power_w / 1000, current_export_w / 1000,
+                target_export_kw,
             )
-            await self._send_charge_command(charge_power_kw, 100)
+            if not await self._send_power_command(-int(charge_power_kw * 1000), _SAFETY_CEILING):
+                return
             self._last_commanded_power_kw = -charge_power_kw
 
         else:
-            _LOGGER.info(
-                f"Dynamic Export: Within tolerance "
-                f"(Grid={grid_power_w/1000:.2f}kW, Target={target_export_kw:.2f}kW)"
+            if _is_redundant_command(
+                "Dynamic Export", 0.0, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(0.0, self._last_commanded_power_kw),
+                "Dynamic Export: Within tolerance (Grid=%.2fkW, Target=%.2fkW)",
+                grid_power_w / 1000, target_export_kw,
             )
-            await self._send_standby_command()
+            if not await self._send_power_command(0, _SAFETY_FLOOR):
+                return
             self._last_commanded_power_kw = 0.0
 
-        self._last_update_time = now
+        self._last_update_mono = now
+        self._last_inputs = inputs
 
     def _get_target_export_kw(self) -> float:
         """Return the desired net grid export setpoint (kW) for this cycle.
@@ -440,152 +839,7 @@ class DynamicExportManager:
         Base implementation reads the static "Dynamic Mode Power Target" entity.
         Subclasses override to compute a dynamic setpoint.
         """
-        return _safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dynamic_mode_power_target",
-            1.0,
-        )
-
-    async def _send_discharge_command(self, power_kw: float, soc_cutoff: int) -> None:
-        """Send force discharge command to inverter.
-
-        Para5 is the system safety floor only (discharging_cutoff_soc register).
-        The user's dispatch target is managed by DispatchSocWatcher in HA.
-        """
-        power_watts = int(power_kw * 1000)
-
-        # Safety floor from inverter's own discharging_cutoff_soc register
-        safety_floor = self._coordinator.data.get("discharging_cutoff_soc", 10) if self._coordinator.data else 10
-        soc_value = soc_percent_to_register(safety_floor)
-
-        # Use the full user-configured duration as the hardware timer so the
-        # inverter cannot self-reset between HA update cycles.
-        values = [
-            1,                              # Para1: Dispatch start
-            0,                              # Para2 high byte
-            MODBUS_OFFSET + power_watts,    # Para2 low: DISCHARGE = 32000 + watts
-            0,                              # Para3 high byte
-            0,                              # Para3 low: Reactive power = 0
-            DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2 (SOC control)
-            soc_value,                      # Para5: SOC cutoff (0-255 range)
-            0,                              # Para6 high byte
-            self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-            255,                            # Para7: Energy routing (default)
-            0,                              # Para8: PV switch (auto)
-        ]
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-
-            # Update coordinator with optimistic values
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", power_watts)
-            self._coordinator.set_optimistic_value("dispatch_mode", self._dispatch_mode_tag)
-
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Export discharge command: {e}")
-            raise
-
-    async def _send_charge_command(self, power_kw: float, soc_target: int) -> None:
-        """Send force charge command to inverter.
-
-        Para5 is the system safety ceiling only (charging_cutoff_soc register).
-        The user's dispatch target is managed by DispatchSocWatcher in HA.
-        """
-        power_watts = int(power_kw * 1000)
-
-        # Safety ceiling from inverter's own charging_cutoff_soc register
-        safety_ceiling = self._coordinator.data.get("charging_cutoff_soc", 100) if self._coordinator.data else 100
-        soc_value = soc_percent_to_register(safety_ceiling)
-
-        # Use the full user-configured duration as the hardware timer so the
-        # inverter cannot self-reset between HA update cycles.
-        values = [
-            1,                              # Para1: Dispatch start
-            0,                              # Para2 high byte
-            MODBUS_OFFSET - power_watts,    # Para2 low: CHARGE = 32000 - watts
-            0,                              # Para3 high byte
-            0,                              # Para3 low: Reactive power = 0
-            DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2 (SOC control)
-            soc_value,                      # Para5: SOC target (0-255 range)
-            0,                              # Para6 high byte
-            self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-            255,                            # Para7: Energy routing (default)
-            0,                              # Para8: PV switch (auto)
-        ]
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-
-            # Update coordinator with optimistic values
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", -power_watts)
-            self._coordinator.set_optimistic_value("dispatch_mode", self._dispatch_mode_tag)
-
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Export charge command: {e}")
-            raise
-
-    async def _send_standby_command(self, soc_limit: int = 0) -> None:
-        """Send standby command (dispatch start=1 but power=0) to keep mode active.
-
-        Para5 uses the system safety floor from the discharging_cutoff_soc register.
-        """
-        safety_floor = self._coordinator.data.get("discharging_cutoff_soc", 10) if self._coordinator.data else 10
-        soc_value = soc_percent_to_register(safety_floor)
-        try:
-            # Keep dispatch active but with 0W command
-            values = [
-                1,                              # Para1: Dispatch start (keep active)
-                0,                              # Para2 high byte
-                MODBUS_OFFSET,                  # Para2 low: 0W (32000 + 0)
-                0,                              # Para3 high byte
-                0,                              # Para3 low: Reactive power = 0
-                DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2
-                soc_value,                      # Para5: SOC cutoff (preserve floor)
-                0,                              # Para6 high byte
-                self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-                255,                            # Para7: Energy routing (default)
-                0,                              # Para8: PV switch (auto)
-            ]
-
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-
-            # Update coordinator with optimistic values
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", 0)
-            self._coordinator.set_optimistic_value("dispatch_mode", self._dispatch_mode_tag)
-
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Export standby command: {e}")
-
-    async def _stop_and_reset_dispatch(self) -> None:
-        """Stop dispatch, reset to Normal mode, and exit Dynamic Export."""
-        from .const import DISPATCH_RESET_VALUES
-
-        _LOGGER.info("Dynamic Export: resetting to Normal mode")
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, DISPATCH_RESET_VALUES
-            )
-            
-            # Update coordinator
-            self._coordinator.set_optimistic_value("dispatch_start", 0)
-            self._coordinator.set_optimistic_value("dispatch_power", 0)
-            self._coordinator.set_optimistic_value("dispatch_mode", 0)
-            
-            # Stop the control loop
-            await self.stop()
-            
-        except Exception as e:
-            _LOGGER.error(f"Failed to stop Dynamic Export dispatch: {e}")
+        return self._get_number(self._uid_power_target, 1.0)
 
 
 # ---------------------------------------------------------------------------
@@ -621,28 +875,29 @@ class DynamicSOCExportManager(DynamicExportManager):
 
     _dispatch_mode_tag = DISPATCH_MODE_DYNAMIC_SOC_EXPORT
 
+    def __init__(self, hass: HomeAssistant, coordinator, client, device_name: str):
+        """Initialize the Dynamic SOC Export Manager."""
+        super().__init__(hass, coordinator, client, device_name)
+        self._uid_target_soc = f"neovolt_{device_name}_dispatch_discharge_target_soc"
+        self._uid_export_buffer = f"neovolt_{device_name}_dispatch_discharge_export_buffer"
+
     def _get_target_export_kw(self) -> float:
         """Compute the export setpoint from SOC pacing and house load."""
         data = self._coordinator.data
 
         # ── Read user inputs ─────────────────────────────────────────────────
-        target_soc = _safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dispatch_discharge_target_soc",
-            float(DYNAMIC_SOC_EXPORT_DEFAULT_TARGET_SOC),
+        target_soc = self._get_number(
+            self._uid_target_soc, float(DYNAMIC_SOC_EXPORT_DEFAULT_TARGET_SOC)
         )
-        buffer_kw = _safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dispatch_discharge_export_buffer",
-            float(DYNAMIC_SOC_EXPORT_DEFAULT_BUFFER),
+        buffer_kw = self._get_number(
+            self._uid_export_buffer, float(DYNAMIC_SOC_EXPORT_DEFAULT_BUFFER)
         )
 
         # ── Remaining time in window ─────────────────────────────────────────
         # Floor at 1 minute so the smooth rate doesn't blow up in the final
-        # seconds; once the window elapses the control loop ends the mode anyway.
-        if self._start_time and self._duration_minutes:
-            elapsed_s = (dt_util.now() - self._start_time).total_seconds()
-            remaining_s = self._duration_minutes * 60.0 - elapsed_s
+        # seconds; once the window elapses the expiry timer ends the mode anyway.
+        if self._deadline_mono is not None:
+            remaining_s = self._deadline_mono - self._loop.time()
             remaining_hours = max(remaining_s / 3600.0, 1.0 / 60.0)
         else:
             remaining_hours = 1.0
@@ -682,10 +937,10 @@ class DynamicSOCExportManager(DynamicExportManager):
         target_export_kw = max(smooth_rate_kw - house_load_kw, buffer_kw)
 
         _LOGGER.debug(
-            f"Dynamic SOC Export: SOC {current_soc:.1f}%→{target_soc:.0f}%, "
-            f"remaining={remaining_hours * 60:.1f}min, capacity={capacity_kwh:.1f}kWh, "
-            f"smooth_rate={smooth_rate_kw:.2f}kW, load={house_load_kw:.2f}kW, "
-            f"buffer={buffer_kw:.2f}kW → target_export={target_export_kw:.2f}kW"
+            "Dynamic SOC Export: SOC %.1f%%→%.0f%%, remaining=%.1fmin, capacity=%.1fkWh, "
+            "smooth_rate=%.2fkW, load=%.2fkW, buffer=%.2fkW → target_export=%.2fkW",
+            current_soc, target_soc, remaining_hours * 60, capacity_kwh,
+            smooth_rate_kw, house_load_kw, buffer_kw, target_export_kw,
         )
         return target_export_kw
 
@@ -694,7 +949,7 @@ class DynamicSOCExportManager(DynamicExportManager):
 # Dynamic Import Manager
 # ---------------------------------------------------------------------------
 
-class DynamicImportManager:
+class DynamicImportManager(DynamicModeManager):
     """Manages Dynamic Import mode — charges battery to maintain a target grid import level.
 
     Calculation:
@@ -710,153 +965,8 @@ class DynamicImportManager:
     The Dynamic Mode Power Target number entity sets the desired import level.
     """
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        coordinator,
-        client,
-        device_name: str,
-    ):
-        """Initialize the Dynamic Import Manager."""
-        self._hass = hass
-        self._coordinator = coordinator
-        self._client = client
-        self._device_name = device_name
-        self._running = False
-        self._task: Optional[asyncio.Task] = None
-        self._last_update_time: Optional[datetime] = None
-        self._last_grid_power_w: Optional[float] = None  # Last grid reading used for debounce
-        self._last_commanded_power_kw: float = 0.0       # Last power sent — used for slew limiting
-        self._start_time: Optional[datetime] = None
-        self._duration_minutes: Optional[int] = None
-        # Hardware timer written to Para6 on every command — set to the full
-        # user-configured duration on start() so the inverter cannot self-reset
-        # between HA update cycles even if several cycles are missed.
-        self._timeout_seconds: int = 600
-
-        # Get max charge/discharge power directly from the coordinator's own config
-        # entry — this is always correct and avoids the previous name-matching loop
-        # which silently fell back to 5 kW defaults whenever device_name didn't
-        # match exactly (e.g. slugified vs. un-slugified names, migrated entries).
-        entry = coordinator.config_entry
-        self._max_discharge_power = entry.data.get(
-            CONF_MAX_DISCHARGE_POWER, DEFAULT_MAX_DISCHARGE_POWER
-        )
-        self._max_charge_power = entry.data.get(
-            CONF_MAX_CHARGE_POWER, DEFAULT_MAX_CHARGE_POWER
-        )
-
-        _LOGGER.info(
-            f"Initialized Dynamic Import Manager for {device_name} "
-            f"(max charge: {self._max_charge_power}kW, "
-            f"max discharge: {self._max_discharge_power}kW)"
-        )
-
-    @property
-    def is_running(self) -> bool:
-        """Check if Dynamic Import mode is currently active."""
-        return self._running
-
-    async def start(self) -> None:
-        """Start the Dynamic Import control loop."""
-        if self._running:
-            _LOGGER.warning("Dynamic Import already running")
-            return
-
-        _duration, duration_default, duration_reason = _safe_get_by_unique_id_with_source(
-            self._hass,
-            f"neovolt_{self._device_name}_dispatch_duration",
-            120.0,
-        )
-        duration_minutes = int(_duration)
-        if duration_default:
-            _LOGGER.warning(
-                f"Dynamic Import is using fallback duration={duration_minutes}min "
-                f"({duration_reason}). The dispatch_duration entity was not available "
-                f"at start time — mode will stop after {duration_minutes} minutes "
-                f"instead of the configured value. "
-                f"To avoid this, ensure all Dispatch number entities are loaded "
-                f"before starting Dynamic Import."
-            )
-
-        _LOGGER.info(f"Starting Dynamic Import mode (duration: {duration_minutes} minutes)")
-        self._running = True
-        self._last_update_time = None
-        self._last_grid_power_w = None
-        self._last_commanded_power_kw = 0.0
-        self._start_time = dt_util.now()
-        self._duration_minutes = duration_minutes
-        # Set hardware timer to full duration so the inverter cannot self-reset
-        # between HA update cycles even if several consecutive cycles are missed.
-        self._timeout_seconds = min(duration_minutes * 60, 65535)
-
-        # Pin grid and battery blocks to fast poll rate for the duration of this mode
-        self._coordinator.polling_manager.pin_block_interval("grid", DYNAMIC_MODE_FAST_POLL_INTERVAL)
-        self._coordinator.polling_manager.pin_block_interval("battery", DYNAMIC_MODE_FAST_POLL_INTERVAL)
-        _LOGGER.info(
-            f"Dynamic Import: pinned grid+battery blocks to {DYNAMIC_MODE_FAST_POLL_INTERVAL}s poll interval"
-        )
-
-        try:
-            self._task = self._hass.async_create_task(self._control_loop())
-            _LOGGER.info("Dynamic Import control loop task created successfully")
-        except Exception as e:
-            _LOGGER.error(f"Failed to create Dynamic Import task: {e}", exc_info=True)
-            self._running = False
-            raise
-
-    async def stop(self) -> None:
-        """Stop the Dynamic Import control loop."""
-        if not self._running:
-            return
-
-        _LOGGER.info("Stopping Dynamic Import mode")
-        self._running = False
-
-        # Release the fast-poll pin so grid+battery return to adaptive control
-        self._coordinator.polling_manager.unpin_block_interval("grid")
-        self._coordinator.polling_manager.unpin_block_interval("battery")
-        _LOGGER.info("Dynamic Import: released grid+battery poll interval pins")
-
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-
-    async def _control_loop(self) -> None:
-        """Main control loop for Dynamic Import mode."""
-        _LOGGER.info("Dynamic Import control loop started")
-
-        try:
-            while self._running:
-                # Check if duration has expired
-                if self._start_time and self._duration_minutes:
-                    elapsed = (dt_util.now() - self._start_time).total_seconds() / 60.0
-                    if elapsed >= self._duration_minutes:
-                        _LOGGER.info(
-                            f"Dynamic Import duration expired ({self._duration_minutes} minutes). "
-                            "Stopping automatically."
-                        )
-                        await self._stop_and_reset_dispatch()
-                        break
-
-                try:
-                    _LOGGER.debug("Dynamic Import: Running update cycle")
-                    await self._update_battery_power()
-                except Exception as e:
-                    _LOGGER.error(f"Error in Dynamic Import control loop: {e}", exc_info=True)
-
-                await asyncio.sleep(DYNAMIC_EXPORT_UPDATE_INTERVAL)
-
-        except asyncio.CancelledError:
-            _LOGGER.info("Dynamic Import control loop cancelled")
-            raise
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error in Dynamic Import control loop: {e}", exc_info=True)
-            self._running = False
+    _mode_label = "Dynamic Import"
+    _dispatch_mode_tag = DISPATCH_MODE_DYNAMIC_IMPORT
 
     async def _update_battery_power(self) -> None:
         """Calculate required battery charge/discharge and send command.
@@ -883,22 +993,14 @@ class DynamicImportManager:
         This prevents the closed-loop from oscillating: once a command is sent and
         the battery responds, the grid reading stabilises near target and subsequent
         cycles correctly see only a small change and skip redundant commands.
+        A resulting command within DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD of the last
+        one (same direction) is not written at all until it is
+        DYNAMIC_EXPORT_REWRITE_SECONDS old.
         """
         data = self._coordinator.data
 
         # Get target import power (kW) from the shared number entity (unique_id lookup)
-        target_import_kw = _safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dynamic_mode_power_target",
-            1.0,
-        )
-
-        # Get charge SOC ceiling from the Dispatch Charge Target SOC entity (unique_id lookup)
-        soc_target = int(_safe_get_by_unique_id(
-            self._hass,
-            f"neovolt_{self._device_name}_dispatch_charge_soc",
-            100.0,
-        ))
+        target_import_kw = self._get_number(self._uid_power_target, 1.0)
 
         # ── Grid power (signed, W) ────────────────────────────────────────────
         # Authoritative system-wide net power — incorporates all inverters,
@@ -908,6 +1010,19 @@ class DynamicImportManager:
             _LOGGER.warning("Cannot calculate Dynamic Import — grid_power_total unavailable")
             return
 
+        # ── Unchanged inputs ──────────────────────────────────────────────────
+        # If the readings and target are exactly those behind the last command,
+        # the meter has not reported anything new — recomputing would at best
+        # repeat that command and, for Method B, apply the same error twice.
+        # After DYNAMIC_EXPORT_STALE_SECONDS the cycle runs anyway.
+        combined_battery_w = data.get(COMBINED_BATTERY_POWER)
+        inputs = (grid_power_w, combined_battery_w, target_import_kw)
+        if (
+            inputs == self._last_inputs
+            and self._loop.time() - self._last_update_mono < DYNAMIC_EXPORT_STALE_SECONDS
+        ):
+            return
+
         # ── Core calculation ──────────────────────────────────────────────────
         # grid_error = grid_power_w - target_import_w
         #   positive → importing more than target → ease off (less charge / more discharge)
@@ -935,8 +1050,8 @@ class DynamicImportManager:
         target_import_w = target_import_kw * 1000
         grid_error_w = grid_power_w - target_import_w
         grid_error_kw = grid_error_w / 1000.0
+        self._adapt_poll_interval(grid_error_w)
 
-        combined_battery_w = data.get(COMBINED_BATTERY_POWER)
         has_follower = (
             self._coordinator.follower_coordinator is not None
             and bool(self._coordinator.follower_coordinator.data)
@@ -945,194 +1060,93 @@ class DynamicImportManager:
             # Method A: accurate baseline from actual combined battery output
             battery_charge_needed_kw = (-combined_battery_w - grid_error_w) / 1000.0
             _LOGGER.debug(
-                f"Dynamic Import [Method A — host+follower]: "
-                f"Target={target_import_w:.0f}W, Grid={grid_power_w:.0f}W, "
-                f"GridError={grid_error_w:.0f}W, CombinedBattery={combined_battery_w:.0f}W, "
-                f"ChargeNeeded={battery_charge_needed_kw:.2f}kW"
+                "Dynamic Import [Method A — host+follower]: "
+                "Target=%.0fW, Grid=%.0fW, GridError=%.0fW, CombinedBattery=%.0fW, "
+                "ChargeNeeded=%.2fkW",
+                target_import_w, grid_power_w, grid_error_w, combined_battery_w,
+                battery_charge_needed_kw,
             )
         else:
             # Method B: host only — step from last commanded power
             delta_kw = max(-DYNAMIC_EXPORT_MAX_STEP_KW, min(DYNAMIC_EXPORT_MAX_STEP_KW, -grid_error_kw))
             battery_charge_needed_kw = self._last_commanded_power_kw + delta_kw
             _LOGGER.debug(
-                f"Dynamic Import [Method B — host only]: "
-                f"Target={target_import_w:.0f}W, Grid={grid_power_w:.0f}W, "
-                f"GridError={grid_error_w:.0f}W, LastCmd={self._last_commanded_power_kw:.2f}kW, "
-                f"Delta={delta_kw:.2f}kW, ChargeNeeded={battery_charge_needed_kw:.2f}kW"
+                "Dynamic Import [Method B — host only]: "
+                "Target=%.0fW, Grid=%.0fW, GridError=%.0fW, LastCmd=%.2fkW, "
+                "Delta=%.2fkW, ChargeNeeded=%.2fkW",
+                target_import_w, grid_power_w, grid_error_w, self._last_commanded_power_kw,
+                delta_kw, battery_charge_needed_kw,
             )
 
         # ── Settle timer ─────────────────────────────────────────────────────
-        now = dt_util.now()
+        now = self._loop.time()
         seconds_since_command = (
-            (now - self._last_update_time).total_seconds()
-            if self._last_update_time else float("inf")
+            now - self._last_update_mono
+            if self._last_update_mono is not None else float("inf")
         )
 
         if seconds_since_command < DYNAMIC_EXPORT_SETTLE_SECONDS:
             _LOGGER.debug(
-                f"Dynamic Import: Waiting for inverter to settle — "
-                f"{seconds_since_command:.0f}s since last command "
-                f"(settle period={DYNAMIC_EXPORT_SETTLE_SECONDS}s), "
-                f"current grid={grid_power_w/1000:.2f}kW"
+                "Dynamic Import: Waiting for inverter to settle — "
+                "%.0fs since last command (settle period=%ss), current grid=%.2fkW",
+                seconds_since_command, DYNAMIC_EXPORT_SETTLE_SECONDS, grid_power_w / 1000,
             )
             return
 
         # ── Send command ─────────────────────────────────────────────────────
+        # Branches are entered above DYNAMIC_EXPORT_MIN_POWER, which the
+        # validated max powers never undercut — only the max clamp applies.
+        # _last_commanded_power_kw is charge-positive (this control law), but
+        # _send_power_command takes inverter watts: positive discharges.
         if battery_charge_needed_kw > DYNAMIC_EXPORT_MIN_POWER:
-            charge_power_kw = min(battery_charge_needed_kw, self._max_charge_power)
-            charge_power_kw = max(charge_power_kw, DYNAMIC_EXPORT_MIN_POWER)
-            _LOGGER.info(
-                f"Dynamic Import: Charging battery at {charge_power_kw:.2f}kW "
-                f"(Grid={grid_power_w/1000:.2f}kW, Target={target_import_kw:.2f}kW)"
+            charge_power_kw = battery_charge_needed_kw
+            if charge_power_kw > self._max_charge_power:
+                charge_power_kw = self._max_charge_power
+            if _is_redundant_command(
+                "Dynamic Import", charge_power_kw, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(charge_power_kw, self._last_commanded_power_kw),
+                "Dynamic Import: Charging battery at %.2fkW (Grid=%.2fkW, Target=%.2fkW)",
+                charge_power_kw, grid_power_w / 1000, target_import_kw,
             )
-            await self._send_charge_command(charge_power_kw, soc_target)
+            if not await self._send_power_command(-int(charge_power_kw * 1000), _SAFETY_CEILING):
+                return
             self._last_commanded_power_kw = charge_power_kw
 
         elif battery_charge_needed_kw < -DYNAMIC_EXPORT_MIN_POWER:
-            discharge_power_kw = min(abs(battery_charge_needed_kw), self._max_discharge_power)
-            discharge_power_kw = max(discharge_power_kw, DYNAMIC_EXPORT_MIN_POWER)
-            _LOGGER.info(
-                f"Dynamic Import: Discharging battery at {discharge_power_kw:.2f}kW "
-                f"to reduce grid import to target "
-                f"(Grid={grid_power_w/1000:.2f}kW, Target={target_import_kw:.2f}kW)"
+            discharge_power_kw = -battery_charge_needed_kw
+            if discharge_power_kw > self._max_discharge_power:
+                discharge_power_kw = self._max_discharge_power
+            if _is_redundant_command(
+                "Dynamic Import", -discharge_power_kw, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(-discharge_power_kw, self._last_commanded_power_kw),
+                "Dynamic Import: Discharging battery at %.2fkW "
+                "to reduce grid import to target (Grid=%.2fkW, Target=%.2fkW)",
+                discharge_power_kw, grid_power_w / 1000, target_import_kw,
             )
-            soc_floor = int(_safe_get_by_unique_id(
-                self._hass,
-                f"neovolt_{self._device_name}_dispatch_discharge_soc",
-                10.0,
-            ))
-            await self._send_discharge_command(discharge_power_kw, soc_floor)
+            if not await self._send_power_command(int(discharge_power_kw * 1000), _SAFETY_FLOOR):
+                return
             self._last_commanded_power_kw = -discharge_power_kw
 
         else:
-            _LOGGER.info(
-                f"Dynamic Import: Within tolerance "
-                f"(Grid={grid_power_w/1000:.2f}kW, Target={target_import_kw:.2f}kW)"
+            if _is_redundant_command(
+                "Dynamic Import", 0.0, self._last_commanded_power_kw, seconds_since_command
+            ):
+                return
+            _LOGGER.log(
+                _command_log_level(0.0, self._last_commanded_power_kw),
+                "Dynamic Import: Within tolerance (Grid=%.2fkW, Target=%.2fkW)",
+                grid_power_w / 1000, target_import_kw,
             )
-            await self._send_standby_command()
+            if not await self._send_power_command(0, _SAFETY_CEILING):
+                return
             self._last_commanded_power_kw = 0.0
 
-        # Record time of this command for settle timer
-        self._last_update_time = now
-
-    async def _send_charge_command(self, power_kw: float, soc_target: int) -> None:
-        """Send force charge command to inverter.
-
-        Para5 is the system safety ceiling only (charging_cutoff_soc register).
-        The user's dispatch target is managed by DispatchSocWatcher in HA.
-        """
-        power_watts = int(power_kw * 1000)
-        safety_ceiling = self._coordinator.data.get("charging_cutoff_soc", 100) if self._coordinator.data else 100
-        soc_value = soc_percent_to_register(safety_ceiling)
-
-        # Use the full user-configured duration as the hardware timer so the
-        # inverter cannot self-reset between HA update cycles.
-        values = [
-            1,                              # Para1: Dispatch start
-            0,                              # Para2 high byte
-            MODBUS_OFFSET - power_watts,    # Para2 low: CHARGE = 32000 - watts
-            0,                              # Para3 high byte
-            0,                              # Para3 low: Reactive power = 0
-            DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2 (SOC control)
-            soc_value,                      # Para5: SOC target (0-255 range)
-            0,                              # Para6 high byte
-            self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-            255,                            # Para7: Energy routing (default)
-            0,                              # Para8: PV switch (auto)
-        ]
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", -power_watts)
-            self._coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_IMPORT)
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Import charge command: {e}")
-            raise
-
-    async def _send_discharge_command(self, power_kw: float, soc_cutoff: int) -> None:
-        """Send force discharge command to counteract PV surplus.
-
-        Para5 is the system safety floor only (discharging_cutoff_soc register).
-        The user's dispatch target is managed by DispatchSocWatcher in HA.
-        """
-        power_watts = int(power_kw * 1000)
-        safety_floor = self._coordinator.data.get("discharging_cutoff_soc", 10) if self._coordinator.data else 10
-        soc_value = soc_percent_to_register(safety_floor)
-
-        # Use the full user-configured duration as the hardware timer so the
-        # inverter cannot self-reset between HA update cycles.
-        values = [
-            1,                              # Para1: Dispatch start
-            0,                              # Para2 high byte
-            MODBUS_OFFSET + power_watts,    # Para2 low: DISCHARGE = 32000 + watts
-            0,                              # Para3 high byte
-            0,                              # Para3 low: Reactive power = 0
-            DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2 (SOC control)
-            soc_value,                      # Para5: SOC cutoff (0-255 range)
-            0,                              # Para6 high byte
-            self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-            255,                            # Para7: Energy routing (default)
-            0,                              # Para8: PV switch (auto)
-        ]
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", power_watts)
-            self._coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_IMPORT)
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Import discharge command: {e}")
-            raise
-
-    async def _send_standby_command(self, soc_limit: int = 100) -> None:
-        """Send standby command to keep mode active at 0W.
-
-        Para5 uses the system safety ceiling from the charging_cutoff_soc register.
-        """
-        safety_ceiling = self._coordinator.data.get("charging_cutoff_soc", 100) if self._coordinator.data else 100
-        soc_value = soc_percent_to_register(safety_ceiling)
-        try:
-            values = [
-                1,                              # Para1: Dispatch start (keep active)
-                0,                              # Para2 high byte
-                MODBUS_OFFSET,                  # Para2 low: 0W
-                0,                              # Para3 high byte
-                0,                              # Para3 low: Reactive power = 0
-                DISPATCH_MODE_POWER_WITH_SOC,   # Para4: Mode 2
-                soc_value,                      # Para5: SOC target (preserve ceiling)
-                0,                              # Para6 high byte
-                self._timeout_seconds,          # Para6 low: Time (seconds) — full duration
-                255,                            # Para7: Energy routing (default)
-                0,                              # Para8: PV switch (auto)
-            ]
-
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
-            self._coordinator.set_optimistic_value("dispatch_start", 1)
-            self._coordinator.set_optimistic_value("dispatch_power", 0)
-            self._coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_IMPORT)
-        except Exception as e:
-            _LOGGER.error(f"Failed to send Dynamic Import standby command: {e}")
-
-    async def _stop_and_reset_dispatch(self) -> None:
-        """Stop dispatch, reset to Normal mode, and exit Dynamic Import."""
-        from .const import DISPATCH_RESET_VALUES
-
-        _LOGGER.info("Dynamic Import: resetting to Normal mode")
-
-        try:
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, DISPATCH_RESET_VALUES
-            )
-            self._coordinator.set_optimistic_value("dispatch_start", 0)
-            self._coordinator.set_optimistic_value("dispatch_power", 0)
-            self._coordinator.set_optimistic_value("dispatch_mode", 0)
-            await self.stop()
-        except Exception as e:
-            _LOGGER.error(f"Failed to stop Dynamic Import dispatch: {e}")
\ No newline at end of file
+        # Record time and inputs of this command for settle timer / debounce
+        self._last_update_mono = now
+        self._last_inputs = inputs
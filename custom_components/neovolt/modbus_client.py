@@ -1,9 +1,15 @@
 """Modbus client for Neovolt/Bytewatt inverter - ENHANCED PROTOCOL COMPLIANCE"""
+import asyncio
+import functools
 import logging
+import random
+import re
+import socket
 import threading
 import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ModbusException, ConnectionException
+from pymodbus.exceptions import ModbusException, ModbusIOException, ConnectionException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,12 +18,117 @@ MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 0.5  # seconds
 MAX_RETRY_DELAY = 5.0  # seconds
 
+# Circuit breaker: after this many consecutive operations fail with transient
+# (connection/timeout) errors the device is treated as down and operations
+# fail fast for CIRCUIT_BREAKER_OPEN_SECONDS; the first one after that is let
+# through as a probe (half-open) and either closes the breaker or re-opens it.
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_OPEN_SECONDS = 30.0
+
 # Protocol requirements from BYTEWATT Modbus_RTU Protocol (V1.12)
 PROTOCOL_COMMAND_INTERVAL = 0.35  # INCREASED: 350ms between commands for safety margin
 PROTOCOL_RESPONSE_TIMEOUT = 10.0  # 10 second timeout (>10S required)
+# Retry budget: no retry is started once this much time (including its
+# backoff) has gone. Sized to fit one full response timeout plus a backoff, so
+# a timed-out request still gets one retry; quicker failures get all of theirs.
+RETRY_DEADLINE = PROTOCOL_RESPONSE_TIMEOUT + MAX_RETRY_DELAY  # seconds
+# TCP connect only needs a round trip to the gateway; fail fast when it's offline
+PROTOCOL_CONNECT_TIMEOUT = 2.0  # seconds
+# Longest a thread waits for a command it queued on the Modbus worker; covers
+# the commands queued ahead of it plus its own retries with room to spare
+QUEUED_COMMAND_TIMEOUT = 60.0  # seconds
 
 # CRITICAL: Additional protocol delay after writes
 PROTOCOL_WRITE_STABILIZATION_DELAY = 0.1  # 100ms for inverter to process write
+DISPATCH_POST_WRITE_DELAY = 0.05  # 50ms extra settling after a 0x0880 dispatch write
+
+# Read coalescing (batch_read)
+MAX_READ_REGISTERS = 125  # FC03 limit per request
+BATCH_READ_MAX_GAP = 8    # registers — largest unrequested hole bridged when merging reads
+
+# TCP keepalive tuning: probe after 30s idle, every 10s, give up after 3 misses,
+# so a silently half-closed gateway link is noticed in ~60s (default: hours)
+TCP_KEEPALIVE_IDLE = 30   # seconds
+TCP_KEEPALIVE_INTERVAL = 10  # seconds
+TCP_KEEPALIVE_COUNT = 3
+
+# Shadow-register write skipping: registers that must always be written even
+# when the shadow says the inverter already holds the value, because the write
+# itself is the command (dispatch restarts its timeout, 0x084F commits a
+# schedule, the clock registers are set to "now").
+SHADOW_WRITE_DENYLIST = frozenset(
+    list(range(0x0880, 0x0880 + 11))  # dispatch command block
+    + [0x084F]                        # time period control flag (schedule commit)
+    + [0x0740, 0x0741, 0x0742]        # system clock
+)
+# Registers touched by write_schedule_registers: the 0x084F commit flag
+# through the last schedule minute register 0x0861
+SCHEDULE_FIRST_REGISTER = 0x084F
+SCHEDULE_REGISTER_COUNT = 0x0862 - 0x084F
+
+# A shadow value only justifies skipping a write while it is this fresh; the
+# vendor app or cloud can change a register the adaptive poll rarely reads
+SHADOW_MAX_AGE = 30.0  # seconds
+
+# Error classification, built once at import rather than per failure.
+# ModbusIOException is what pymodbus raises when a request gets no response
+# ("No response received after 0 retries ..."); it is transient by type, since
+# its message matches none of the keywords below.
+_TRANSIENT_EXCEPTIONS = (
+    ConnectionException, ModbusIOException, ConnectionError, TimeoutError, OSError
+)
+_TRANSIENT_MESSAGE_RE = re.compile(
+    r"timeout|connection|unreachable|refused|reset", re.IGNORECASE
+)
+# Modbus exception codes that mean "try again later" rather than "never":
+# ACKNOWLEDGE, SLAVE_DEVICE_BUSY, and the two gateway path/target failures
+_TRANSIENT_EXCEPTION_CODES = frozenset((0x05, 0x06, 0x0A, 0x0B))
+# Failures after which the socket state is suspect and must be reopened
+_RECONNECT_EXCEPTIONS = (ConnectionException, ModbusIOException, OSError)
+
+
+@functools.lru_cache(maxsize=256)
+def _operation_name(verb: str, address: int) -> str:
+    """Retry/log label for an operation, e.g. "Read registers 0x102".
+
+    Only built when _retry_operation actually logs; the register map is
+    small and fixed, so each label is formatted once and then served from
+    cache.
+    """
+    return f"{verb} {hex(address)}"
+
+
+def _merge_read_windows(specs):
+    """Group (address, count) ranges into as few FC03 reads as possible.
+
+    Ranges that overlap or sit within BATCH_READ_MAX_GAP registers of each
+    other share one read of up to MAX_READ_REGISTERS. Returns
+    [[start, end, [(address, count), ...]], ...] in address order.
+    """
+    windows = []
+    for address, count in sorted(specs):
+        if windows:
+            window = windows[-1]
+            end = max(window[1], address + count)
+            if address - window[1] <= BATCH_READ_MAX_GAP and end - window[0] <= MAX_READ_REGISTERS:
+                window[1] = end
+                window[2].append((address, count))
+                continue
+        windows.append([address, address + count, [(address, count)]])
+    return windows
+
+
+class ModbusExceptionResponse(ModbusException):
+    """The device answered a request with a Modbus exception response.
+
+    Raised instead of a plain ModbusException so retry handling can tell an
+    answer the firmware will repeat (illegal function/address/value) from a
+    transport failure, without parsing the message.
+    """
+
+    def __init__(self, message, exception_code):
+        super().__init__(message)
+        self.exception_code = exception_code
 
 
 class NeovoltModbusClient:
@@ -25,18 +136,267 @@ class NeovoltModbusClient:
     
     def __init__(self, host, port, slave_id):
         """Initialize the Modbus client."""
+        # Validated once here rather than on every read/write
+        if not isinstance(slave_id, int):
+            raise ValueError(f"Invalid slave_id type: {type(slave_id)}. Expected int.")
         self.host = host
         self.port = port
         self.slave_id = slave_id
         self.client = None
-        self._lock = threading.Lock()  # Protect connection state AND command timing
-        self._sequence_lock = threading.Lock()  # Serialise multi-register write sequences
+        # Guards connection state against close(), the one method that runs
+        # off the worker. Command timing and multi-request sequences need no
+        # lock: only the single worker thread ever touches them.
+        self._lock = threading.Lock()
         self._last_error = None
         self._consecutive_errors = 0
-        self._is_closing = False
-        self._last_command_time = 0
-        self._last_write_time = 0  # Track writes separately for extra delay
-        _LOGGER.info(f"Initialized Modbus client for {host}:{port} (slave: {slave_id})")
+        # (value, monotonic read time) of every (slave_id, register) as last
+        # reported by the inverter, used to skip writes it already holds.
+        # Filled by reads only — writes drop their registers, since only a
+        # read shows what the inverter actually accepted — and trusted for
+        # SHADOW_MAX_AGE. Only touched on the Modbus worker, and dropped on
+        # every (re)connect.
+        self._shadow: dict[tuple[int, int], tuple[int, float]] = {}
+        # Set while the client is closing (permanently after close()); an
+        # Event rather than a bool so protocol and backoff sleeps wait on it
+        # and wake immediately on shutdown instead of running to completion.
+        self._closing_event = threading.Event()
+        # Set when a failure leaves the socket state suspect (connection
+        # error, or no response — a late reply would desync the next
+        # transaction); the next operation reconnects even if pymodbus still
+        # reports the socket as connected. Plain Modbus exception responses
+        # leave the connection alone.
+        self._needs_reconnect = False
+        # Circuit breaker state per slave_id (one dead inverter behind a shared
+        # gateway must not fast-fail the others): consecutive failed
+        # operations, and the monotonic time until which operations fail fast
+        self._breaker_failures: dict[int, int] = {}
+        self._breaker_open_until: dict[int, float] = {}
+        # time.monotonic() at which the last command / write was (or will be,
+        # once its protocol delay elapses) sent. -inf so the first command
+        # never waits.
+        self._last_command_mono = -float("inf")
+        self._last_write_mono = -float("inf")  # Track writes separately for extra delay
+        self._extra_next_delay = 0.0  # One-off settling time added before the next command
+        # Dedicated single worker that owns this device's Modbus I/O. Every
+        # read/write, whether awaited from the event loop or called from some
+        # other thread, is queued onto it, so commands run strictly one at a
+        # time in submission order and never queue behind unrelated blocking
+        # jobs in Home Assistant's shared executor. Threads are only started
+        # on first use.
+        self._worker_state = threading.local()
+        # Reads queued on the worker but not yet finished, keyed by
+        # (slave_id, address, count), so identical concurrent reads share one
+        # request.
+        self._inflight_reads: dict[tuple[int, int, int], Future] = {}
+        # Re-entrant: add_done_callback runs _forget_read inline (under this
+        # lock) when the read has already finished.
+        self._inflight_lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"neovolt_modbus_{host}",
+            initializer=self._mark_worker_thread,
+        )
+        _LOGGER.info("Initialized Modbus client for %s:%s (slave: %s)", host, port, slave_id)
+
+    # ── Shared connections ──────────────────────────────────────────────────
+    # Several inverters (host + follower) often sit behind one RS485-to-TCP
+    # gateway under different slave IDs, and those gateways only accept 2–4
+    # TCP connections. acquire() hands out one NeovoltModbusDevice per slave
+    # but interns the underlying client per (host, port), so all slaves share
+    # one socket, one worker and one protocol-interval clock; the connection
+    # is closed when the last device releases it.
+
+    _shared: dict[tuple[str, int], list] = {}  # (host, port) -> [client, users]
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, host, port, slave_id) -> "NeovoltModbusDevice":
+        """Return a device handle for slave_id on the shared (host, port) client."""
+        with cls._shared_lock:
+            entry = cls._shared.get((host, port))
+            if entry is None:
+                entry = cls._shared[(host, port)] = [cls(host, port, slave_id), 0]
+            else:
+                _LOGGER.info("Sharing Modbus connection to %s:%s with slave %s", host, port, slave_id)
+            entry[1] += 1
+            return NeovoltModbusDevice(entry[0], slave_id)
+
+    def release(self) -> None:
+        """Drop one acquire() reference; close the connection after the last."""
+        with NeovoltModbusClient._shared_lock:
+            entry = NeovoltModbusClient._shared.get((self.host, self.port))
+            if entry is None or entry[0] is not self:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del NeovoltModbusClient._shared[(self.host, self.port)]
+        self.close()
+
+    def _device(self, slave_id) -> int:
+        """Resolve an optional per-call slave_id to the device to address."""
+        return self.slave_id if slave_id is None else slave_id
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Single-thread executor reserved for this client's Modbus I/O."""
+        return self._executor
+
+    def _mark_worker_thread(self) -> None:
+        """Executor initializer: flag the worker thread as the I/O owner."""
+        self._worker_state.is_worker = True
+
+    def _on_worker(self) -> bool:
+        """True when running on this client's dedicated Modbus worker."""
+        return getattr(self._worker_state, "is_worker", False)
+
+    def _run_on_worker(self, func, *args):
+        """Queue func onto the Modbus worker and block until it completes.
+
+        Lets the blocking public methods be called from any thread while the
+        worker stays the only thread that talks to the device.
+        """
+        try:
+            future = self._executor.submit(func, *args)
+        except RuntimeError:
+            # Executor shut down by close(): the client is no longer in use
+            _LOGGER.debug("Modbus worker for %s:%s is shut down", self.host, self.port)
+            return None
+        return self._wait_result(future)
+
+    def _wait_result(self, future: Future):
+        """Block for a queued command's result; None if it never ran or took too long.
+
+        close() cancels commands still waiting in the queue, and a wedged
+        worker must not hang the calling thread forever — both surface as
+        the usual failure value rather than an exception.
+        """
+        try:
+            return future.result(timeout=QUEUED_COMMAND_TIMEOUT)
+        except CancelledError:
+            _LOGGER.debug("Queued Modbus command for %s:%s cancelled by close()", self.host, self.port)
+            return None
+        except TimeoutError:
+            _LOGGER.warning(
+                "Queued Modbus command for %s:%s did not complete within %.0fs",
+                self.host, self.port, QUEUED_COMMAND_TIMEOUT,
+            )
+            return None
+
+    def _queue_read(self, address, count, slave_id) -> Future:
+        """Queue a read on the worker, joining an identical read already queued.
+
+        Single-flight: every caller asking for the same (address, count)
+        while a read is pending gets that read's future instead of paying
+        another protocol interval for a second request. Raises RuntimeError
+        once close() has shut the worker down.
+        """
+        key = (slave_id, address, count)
+        with self._inflight_lock:
+            future = self._inflight_reads.get(key)
+            if future is None:
+                future = self._executor.submit(self.read_holding_registers, address, count, slave_id)
+                self._inflight_reads[key] = future
+                future.add_done_callback(lambda done: self._forget_read(key, done))
+            return future
+
+    def _forget_read(self, key, future) -> None:
+        """Drop a finished read from the in-flight map (unless already replaced)."""
+        with self._inflight_lock:
+            if self._inflight_reads.get(key) is future:
+                del self._inflight_reads[key]
+
+    def _forget_overlapping_reads(self, slave_id, address, count) -> None:
+        """Stop pending reads of a range about to be written from being joined.
+
+        Called when a write is requested: a read queued before it may return
+        pre-write values, so callers asking from now on must queue a fresh
+        read (which runs after the write) instead of sharing that one. The
+        earlier read still completes for the callers already waiting on it.
+        """
+        end = address + count
+        with self._inflight_lock:
+            stale = [
+                key for key in self._inflight_reads
+                if key[0] == slave_id and key[1] < end and address < key[1] + key[2]
+            ]
+            for key in stale:
+                del self._inflight_reads[key]
+
+    # ── Event-loop API ──────────────────────────────────────────────────────
+    # Awaitable counterparts of the blocking methods below, for callers on the
+    # Home Assistant event loop. Each runs the blocking call on this client's
+    # dedicated worker thread (not HA's shared executor), so retry, reconnect
+    # and BYTEWATT command-interval handling stay in one place while the loop
+    # only awaits a future. The returned futures can be shielded directly.
+
+    def async_run(self, func, *args) -> asyncio.Future:
+        """Run blocking Modbus work on the dedicated worker.
+
+        For multi-command jobs such as a coordinator poll cycle, whose
+        protocol delays should sleep on this worker rather than in HA's
+        shared executor.
+        """
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def async_force_reconnect(self, slave_id=None) -> asyncio.Future:
+        """Awaitable force_reconnect()."""
+        return self.async_run(self.force_reconnect, slave_id)
+
+    def async_read_holding_registers(self, address, count, slave_id=None) -> asyncio.Future:
+        """Awaitable read_holding_registers(), coalesced with identical pending reads."""
+        try:
+            future = self._queue_read(address, count, self._device(slave_id))
+        except RuntimeError:
+            # Worker shut down by close(): same failure value as any other read
+            _LOGGER.debug("Modbus worker for %s:%s is shut down", self.host, self.port)
+            result = asyncio.get_running_loop().create_future()
+            result.set_result(None)
+            return result
+        # Shielded so one cancelled caller doesn't cancel the shared read
+        # under the others.
+        return asyncio.shield(asyncio.wrap_future(future))
+
+    async def async_batch_read(
+        self, specs: list[tuple[int, int]], slave_id=None
+    ) -> dict[int, list[int]]:
+        """Awaitable batch_read() that lets writes cut in between its reads.
+
+        Each merged read is queued on the worker as its own job, so a write
+        requested mid-poll waits for at most the read in progress rather
+        than the whole cycle.
+        """
+        results = {}
+        for start, end, members in _merge_read_windows(specs):
+            regs = await self.async_read_holding_registers(start, end - start, slave_id)
+            if not regs:
+                continue
+            for address, count in members:
+                offset = address - start
+                results[address] = regs[offset:offset + count]
+        return results
+
+    def async_write_register(self, address, value, slave_id=None) -> asyncio.Future:
+        """Awaitable write_register()."""
+        self._forget_overlapping_reads(self._device(slave_id), address, 1)
+        return self.async_run(self.write_register, address, value, slave_id)
+
+    def async_write_registers(self, address, values, slave_id=None) -> asyncio.Future:
+        """Awaitable write_registers()."""
+        values = tuple(values)
+        self._forget_overlapping_reads(self._device(slave_id), address, len(values))
+        return self.async_run(self.write_registers, address, values, slave_id)
+
+    def async_write_schedule_registers(
+        self, register_value_pairs: list[tuple[int, int]], control_flag: int = 0, slave_id=None
+    ) -> asyncio.Future:
+        """Awaitable write_schedule_registers()."""
+        self._forget_overlapping_reads(
+            self._device(slave_id), SCHEDULE_FIRST_REGISTER, SCHEDULE_REGISTER_COUNT
+        )
+        return self.async_run(
+            self.write_schedule_registers, register_value_pairs, control_flag, slave_id
+        )
 
     def _enforce_command_interval(self, is_write=False):
         """
@@ -48,96 +408,126 @@ class NeovoltModbusClient:
         Args:
             is_write: If True, enforces additional delay after last write command
         """
-        with self._lock:
-            current_time = time.time()
-            
-            # Calculate required delay based on last command type
-            if is_write and self._last_write_time > 0:
-                # After a write, enforce both command interval AND stabilization delay
-                time_since_write = current_time - self._last_write_time
-                min_delay = PROTOCOL_COMMAND_INTERVAL + PROTOCOL_WRITE_STABILIZATION_DELAY
-                if time_since_write < min_delay:
-                    sleep_time = min_delay - time_since_write
-                else:
-                    sleep_time = 0
-            else:
-                # Normal command interval
-                time_since_last = current_time - self._last_command_time
-                if time_since_last < PROTOCOL_COMMAND_INTERVAL:
-                    sleep_time = PROTOCOL_COMMAND_INTERVAL - time_since_last
-                else:
-                    sleep_time = 0
-            
-            # Update timestamps while holding lock
-            self._last_command_time = time.time()
-            if is_write:
-                self._last_write_time = time.time()
+        # Monotonic so NTP adjustments can't skew the spacing
+        current_time = time.monotonic()
+        
+        # Normal command interval, plus any settling time the previous
+        # command asked for (e.g. after a dispatch write)
+        min_delay = PROTOCOL_COMMAND_INTERVAL + self._extra_next_delay
+        self._extra_next_delay = 0.0
+        sleep_time = min_delay - (current_time - self._last_command_mono)
+        if is_write:
+            # After a write, also enforce the stabilization delay before the next write
+            min_write_delay = PROTOCOL_COMMAND_INTERVAL + PROTOCOL_WRITE_STABILIZATION_DELAY
+            sleep_time = max(sleep_time, min_write_delay - (current_time - self._last_write_mono))
+        sleep_time = max(sleep_time, 0)
+        
+        # Record the intended send time (after our sleep)
+        send_time = current_time + sleep_time
+        self._last_command_mono = send_time
+        if is_write:
+            self._last_write_mono = send_time
 
-        # Sleep outside lock to avoid blocking other operations
         if sleep_time > 0:
-            _LOGGER.debug(f"Enforcing protocol delay: {sleep_time:.3f}s ({'write' if is_write else 'read'})")
-            time.sleep(sleep_time)
+            _LOGGER.debug(
+                "Enforcing protocol delay: %.3fs (%s)", sleep_time, "write" if is_write else "read"
+            )
+            if self._closing_event.wait(sleep_time):
+                raise ConnectionException("Client is being closed")
 
     @staticmethod
     def _is_transient_error(exception):
         """Determine if an error is transient (can be retried) or permanent."""
-        if isinstance(exception, (ConnectionException, ConnectionError, TimeoutError, OSError)):
+        if isinstance(exception, _TRANSIENT_EXCEPTIONS):
             return True
 
+        if isinstance(exception, ModbusExceptionResponse):
+            # Retrying an illegal address/value just repeats the same answer
+            return exception.exception_code in _TRANSIENT_EXCEPTION_CODES
+
         if isinstance(exception, ModbusException):
-            error_str = str(exception).lower()
-            transient_keywords = ['timeout', 'connection', 'unreachable', 'refused', 'reset']
-            if any(keyword in error_str for keyword in transient_keywords):
-                return True
+            return _TRANSIENT_MESSAGE_RE.search(str(exception)) is not None
 
         return False
 
-    def _retry_operation(self, operation, operation_name, *args, **kwargs):
-        """Execute an operation with retry logic for transient errors."""
-        retry_delay = INITIAL_RETRY_DELAY
+    def _retry_operation(self, operation, verb, slave_id, address, *args):
+        """Execute operation(address, *args, slave_id) with retry logic for transient errors.
+
+        verb and address only become a log label (see _operation_name) on a
+        path that logs, so the success path formats nothing.
+        """
         last_exception = None
+        start = time.monotonic()
+
+        if start < self._breaker_open_until.get(slave_id, 0.0):
+            _LOGGER.debug(
+                "%s skipped - device unreachable (circuit breaker open)",
+                _operation_name(verb, address),
+            )
+            return None
 
         for attempt in range(1, MAX_RETRIES + 1):
-            if self._is_closing:
-                _LOGGER.debug(f"{operation_name} cancelled - client is closing")
+            if self._closing_event.is_set():
+                _LOGGER.debug("%s cancelled - client is closing", _operation_name(verb, address))
                 return None
 
             try:
-                result = operation(*args, **kwargs)
+                result = operation(address, *args, slave_id)
 
                 if self._consecutive_errors > 0:
                     _LOGGER.info(
-                        f"{operation_name} succeeded after {self._consecutive_errors} consecutive errors"
+                        "%s succeeded after %d consecutive errors",
+                        _operation_name(verb, address), self._consecutive_errors,
                     )
                     self._consecutive_errors = 0
                     self._last_error = None
+                if self._breaker_failures.get(slave_id):
+                    self._close_breaker(slave_id)
 
                 return result
 
             except Exception as e:
                 last_exception = e
                 is_transient = self._is_transient_error(e)
-
-                if attempt < MAX_RETRIES and is_transient:
-                    log_level = _LOGGER.debug if attempt == 1 else _LOGGER.warning
-                    log_level(
-                        f"{operation_name} failed (attempt {attempt}/{MAX_RETRIES}): {e}. "
-                        f"Retrying in {retry_delay:.1f}s..."
+                if isinstance(e, _RECONNECT_EXCEPTIONS):
+                    self._needs_reconnect = True
+
+                # Exponential backoff with "equal jitter": wait between half
+                # and all of the capped delay, so coordinators that failed
+                # together (HA restart, inverter reboot) don't retry in
+                # lockstep and stampede the gateway.
+                cap = min(MAX_RETRY_DELAY, INITIAL_RETRY_DELAY * (1 << (attempt - 1)))
+                retry_delay = random.uniform(cap * 0.5, cap)
+                # Total time budget: a timed-out request gets one retry, but a
+                # second timeout fails the operation (counted by the circuit
+                # breaker below) rather than stalling the poll further.
+                within_deadline = time.monotonic() - start + retry_delay <= RETRY_DEADLINE
+
+                if attempt < MAX_RETRIES and is_transient and within_deadline:
+                    _LOGGER.log(
+                        logging.DEBUG if attempt == 1 else logging.WARNING,
+                        "%s failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                        _operation_name(verb, address), attempt, MAX_RETRIES, e, retry_delay,
                     )
-                    time.sleep(retry_delay)
-                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+                    if self._closing_event.wait(retry_delay):
+                        _LOGGER.debug("%s cancelled - client is closing", _operation_name(verb, address))
+                        return None
                 else:
+                    operation_name = _operation_name(verb, address)
                     error_type = "transient" if is_transient else "permanent"
-                    error_signature = f"{type(e).__name__}:{str(e)}"
+                    # Cheap "same error as last time?" key: type plus args,
+                    # no string formatting unless something is logged
+                    error_signature = (type(e), e.args)
                     
                     if error_signature != self._last_error:
                         if is_transient and self._consecutive_errors == 0:
                             _LOGGER.warning(
-                                f"{operation_name} temporarily unavailable ({error_type} error): {e}"
+                                "%s temporarily unavailable (%s error): %s",
+                                operation_name, error_type, e,
                             )
                         else:
                             _LOGGER.error(
-                                f"{operation_name} failed ({error_type} error): {e}"
+                                "%s failed (%s error): %s", operation_name, error_type, e
                             )
                         self._last_error = error_signature
                         self._consecutive_errors = 1
@@ -145,64 +535,174 @@ class NeovoltModbusClient:
                         self._consecutive_errors += 1
                         if self._consecutive_errors % 10 == 0:
                             _LOGGER.error(
-                                f"{operation_name} failed {self._consecutive_errors} consecutive times: {e}"
+                                "%s failed %d consecutive times: %s",
+                                operation_name, self._consecutive_errors, e,
                             )
+                    # Only unreachability (or a device too busy to answer)
+                    # counts — any other exception response means the device
+                    # is up and answering
+                    if is_transient:
+                        self._record_breaker_failure(slave_id)
                     break
 
         return None
 
+    @property
+    def circuit_open(self) -> bool:
+        """True while the circuit breaker is failing operations fast."""
+        return self.is_circuit_open(self.slave_id)
+
+    def is_circuit_open(self, slave_id) -> bool:
+        """True while slave_id's circuit breaker is failing operations fast."""
+        return time.monotonic() < self._breaker_open_until.get(slave_id, 0.0)
+
+    def _record_breaker_failure(self, slave_id) -> None:
+        """Count a failed operation; open (or re-open) the breaker at the threshold."""
+        failures = self._breaker_failures[slave_id] = self._breaker_failures.get(slave_id, 0) + 1
+        if failures < CIRCUIT_BREAKER_THRESHOLD:
+            return
+        if slave_id not in self._breaker_open_until:
+            _LOGGER.warning(
+                "%s:%s slave %s unreachable after %d failed operations - "
+                "failing fast, probing every %.0fs",
+                self.host, self.port, slave_id, failures, CIRCUIT_BREAKER_OPEN_SECONDS,
+            )
+        self._breaker_open_until[slave_id] = time.monotonic() + CIRCUIT_BREAKER_OPEN_SECONDS
+
+    def _close_breaker(self, slave_id) -> None:
+        """Reset slave_id's circuit breaker after a successful operation."""
+        if self._breaker_open_until.pop(slave_id, None) is not None:
+            _LOGGER.info(
+                "%s:%s slave %s reachable again - circuit breaker closed",
+                self.host, self.port, slave_id,
+            )
+        self._breaker_failures.pop(slave_id, None)
+
     def connect(self):
         """Establish connection to the Modbus device with improved restart handling."""
+        self._shadow.clear()
         try:
             if self.client:
                 try:
                     self.client.close()
-                    time.sleep(0.2)  # Gateway connection release delay
                 except Exception:
                     pass
+                # Gateway connection release delay (cut short by close())
+                if self._closing_event.wait(0.2):
+                    self.client = None
+                    return False
             
+            # pymodbus uses one timeout for both connect and response waits;
+            # start with the short connect timeout and raise it to the
+            # protocol's response timeout once the socket is up
+            # retries=0: pymodbus would otherwise re-send an unanswered request
+            # up to 3 times itself — each after a full response timeout and
+            # with no protocol interval — nested inside our own retries.
+            # _retry_operation owns retrying; a silent socket is reopened via
+            # _needs_reconnect rather than probed with a heartbeat.
             self.client = ModbusTcpClient(
                 host=self.host,
                 port=self.port,
-                timeout=PROTOCOL_RESPONSE_TIMEOUT
+                timeout=PROTOCOL_CONNECT_TIMEOUT,
+                retries=0,
             )
             
-            connected = False
-            for attempt in range(2):
-                try:
-                    connected = self.client.connect()
-                    if connected:
-                        break
-                except (ConnectionError, OSError) as e:
-                    if attempt == 0:
-                        _LOGGER.debug(f"Connection attempt {attempt + 1} failed, retrying: {e}")
-                        time.sleep(0.3)
-                    else:
-                        raise
-            
+            # Single attempt: retries (with backoff, deadline and circuit
+            # breaker) are the caller's _retry_operation's job
+            connected = self.client.connect()
+
             if connected:
-                _LOGGER.info(f"Connected to Modbus device at {self.host}:{self.port}")
-                time.sleep(0.1)  # Device stabilization delay
+                self._needs_reconnect = False
+                # A fresh connection has carried no command yet, and the
+                # release/handshake/stabilization delays already exceed the
+                # command interval — the first command needn't wait. The
+                # write timestamp is kept: write stabilization is about the
+                # inverter applying the last write, not the socket.
+                self._last_command_mono = -float("inf")
+                self._extra_next_delay = 0.0
+                comm_params = getattr(self.client, "comm_params", None)
+                if comm_params is not None:
+                    comm_params.timeout_connect = PROTOCOL_RESPONSE_TIMEOUT
+                self._configure_socket()
+                _LOGGER.info("Connected to Modbus device at %s:%s", self.host, self.port)
+                self._closing_event.wait(0.1)  # Device stabilization delay (cut short by close())
             else:
-                _LOGGER.error(f"Failed to connect to Modbus device at {self.host}:{self.port}")
+                _LOGGER.error("Failed to connect to Modbus device at %s:%s", self.host, self.port)
                 self.client = None
 
             return connected
 
         except Exception as e:
-            _LOGGER.error(f"Connection error for {self.host}:{self.port}: {e}")
+            _LOGGER.error("Connection error for %s:%s: %s", self.host, self.port, e)
             self.client = None
             return False
     
-    def test_connection(self):
+    def _configure_socket(self):
+        """Tune the freshly connected TCP socket for small request/response PDUs.
+
+        TCP_NODELAY stops Nagle holding our ~12 byte requests back waiting on
+        the gateway's delayed ACK, and SO_KEEPALIVE lets the kernel notice a
+        dead inverter connection between polls instead of on the next read.
+        The keepalive timers are tightened where the platform exposes them
+        (TCP_KEEPIDLE on Linux, TCP_KEEPALIVE on macOS).
+        """
+        sock = getattr(self.client, "socket", None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            idle_opt = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+            if idle_opt is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, idle_opt, TCP_KEEPALIVE_IDLE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, TCP_KEEPALIVE_COUNT)
+        except OSError as e:
+            _LOGGER.debug("Could not set socket options for %s:%s: %s", self.host, self.port, e)
+
+    def _connected_client(self):
+        """Return a connected pymodbus client, (re)connecting first if needed.
+
+        Double-checked: the steady-state (connected) path only reads
+        self.client into a local, and the lock is taken just to decide and
+        perform a reconnect. The caller uses the returned reference, so a
+        concurrent close() nulling self.client can't pull it away mid-call.
+        """
+        if self._closing_event.is_set():
+            raise ConnectionException("Client is being closed")
+
+        client_ref = self.client
+        if self._needs_reconnect or client_ref is None or not client_ref.connected:
+            with self._lock:
+                if self._closing_event.is_set():
+                    raise ConnectionException("Client is being closed")
+
+                if self._needs_reconnect or not self.client or not self.client.connected:
+                    if not self.connect():
+                        raise ConnectionException(
+                            f"Failed to establish connection to {self.host}:{self.port}"
+                        )
+
+                # connect() only reports success with self.client set, and
+                # close() can't null it while we hold the lock
+                client_ref = self.client
+
+        return client_ref
+
+    def test_connection(self, slave_id=None):
         """Test connection by reading Battery SOC register (0x0102)."""
+        if not self._on_worker():
+            return bool(self._run_on_worker(self.test_connection, slave_id))
+
         try:
             with self._lock:
                 if not self.client:
                     if not self.connect():
                         return False
 
-                _LOGGER.info(f"Testing connection to {self.host}:{self.port}")
+                _LOGGER.info("Testing connection to %s:%s", self.host, self.port)
 
                 if not self.client.connected:
                     _LOGGER.info("TCP not connected, attempting connection...")
@@ -218,169 +718,236 @@ class NeovoltModbusClient:
             result = client_ref.read_holding_registers(
                 address=0x0102,
                 count=1,
-                device_id=self.slave_id
+                device_id=self._device(slave_id)
             )
 
             if result.isError():
-                _LOGGER.error(f"Modbus error reading register: {result}")
+                _LOGGER.error("Modbus error reading register: %s", result)
                 return False
 
             soc_value = result.registers[0]
-            _LOGGER.info(f"Connection successful! Battery SOC: {soc_value * 0.1}%")
+            _LOGGER.info("Connection successful! Battery SOC: %s%%", soc_value * 0.1)
             return True
 
         except ModbusException as e:
-            _LOGGER.error(f"Modbus exception during test: {e}")
+            _LOGGER.error("Modbus exception during test: %s", e)
             return False
         except AttributeError as e:
-            _LOGGER.error(f"API compatibility error: {e}")
+            _LOGGER.error("API compatibility error: %s", e)
             _LOGGER.error("This may indicate pymodbus version incompatibility")
             return False
         except Exception as e:
-            _LOGGER.error(f"Connection test failed: {e}")
+            _LOGGER.error("Connection test failed: %s", e)
             return False
     
-    def read_holding_registers(self, address, count):
+    def read_holding_registers(self, address, count, slave_id=None):
         """Read holding registers from the device with retry logic."""
-        def _read_operation():
-            if self._is_closing:
-                raise ConnectionException("Client is being closed")
-
-            with self._lock:
-                if self._is_closing:
-                    raise ConnectionException("Client is being closed")
-                    
-                if not self.client or not self.client.connected:
-                    if not self.connect():
-                        raise ConnectionException(
-                            f"Failed to establish connection to {self.host}:{self.port}"
-                        )
-                
-                client_ref = self.client
+        slave_id = self._device(slave_id)
+        if not self._on_worker():
+            try:
+                return self._wait_result(self._queue_read(address, count, slave_id))
+            except RuntimeError:
+                _LOGGER.debug("Modbus worker for %s:%s is shut down", self.host, self.port)
+                return None
 
-            if not client_ref:
-                raise ConnectionException("Client not initialized after connection attempt")
-            
-            if not isinstance(self.slave_id, int):
-                raise ValueError(f"Invalid slave_id type: {type(self.slave_id)}. Expected int.")
+        if count > MAX_READ_REGISTERS:
+            # One FC03 response carries at most 125 registers: split into
+            # back-to-back maximal reads (each with its own retries) and
+            # return the joined result, or None if any part failed.
+            registers = []
+            for offset in range(0, count, MAX_READ_REGISTERS):
+                part = self._retry_operation(
+                    self._do_read, "Read registers", slave_id,
+                    address + offset, min(MAX_READ_REGISTERS, count - offset),
+                )
+                if part is None:
+                    return None
+                registers.extend(part)
+            return registers
+
+        return self._retry_operation(self._do_read, "Read registers", slave_id, address, count)
+
+    def _do_read(self, address, count, slave_id):
+        """One read attempt; retried by read_holding_registers()."""
+        client_ref = self._connected_client()
+
+        # Enforce protocol delay BEFORE read
+        self._enforce_command_interval(is_write=False)
+
+        result = client_ref.read_holding_registers(
+            address=address,
+            count=count,
+            device_id=slave_id
+        )
+
+        if result.isError():
+            raise ModbusExceptionResponse(
+                f"Modbus error reading registers {hex(address)}: {result}",
+                getattr(result, "exception_code", None),
+            )
 
-            # Enforce protocol delay BEFORE read
-            self._enforce_command_interval(is_write=False)
+        read_at = time.monotonic()
+        self._shadow.update(
+            ((slave_id, address + i), (value, read_at)) for i, value in enumerate(result.registers)
+        )
+        return result.registers
+    
+    def batch_read(self, specs: list[tuple[int, int]], slave_id=None) -> dict[int, list[int]]:
+        """Read several (address, count) ranges with as few requests as possible.
 
-            result = client_ref.read_holding_registers(
-                address=address,
-                count=count,
-                device_id=self.slave_id
-            )
+        Every request pays PROTOCOL_COMMAND_INTERVAL plus a round trip, so
+        ranges that overlap or sit within BATCH_READ_MAX_GAP registers of each
+        other are merged into one FC03 read (up to MAX_READ_REGISTERS) and the
+        result is sliced back per range. The gap is kept small so a merged
+        read never strays far into registers the inverter may not implement.
 
-            if result.isError():
-                raise ModbusException(f"Modbus error reading registers {hex(address)}: {result}")
+        Returns:
+            {address: registers} for each requested range whose read
+            succeeded; ranges from a failed read are simply absent.
+        """
+        if not self._on_worker():
+            return self._run_on_worker(self.batch_read, specs, slave_id) or {}
+
+        # The BYTEWATT protocol forbids pipelining (>300 ms between commands,
+        # one outstanding request), so the batch cannot be sent in one round
+        # trip. Here it runs as one uninterrupted worker job; use
+        # async_batch_read() when writes should be able to cut in.
+        results = {}
+        for start, end, members in _merge_read_windows(specs):
+            regs = self.read_holding_registers(start, end - start, slave_id)
+            if not regs:
+                continue
+            for address, count in members:
+                offset = address - start
+                results[address] = regs[offset:offset + count]
+        return results
+
+    def _shadow_holds(self, slave_id, address, values) -> bool:
+        """True when a recent read shows the inverter already holds values at address."""
+        if not SHADOW_WRITE_DENYLIST.isdisjoint(range(address, address + len(values))):
+            return False
+        oldest = time.monotonic() - SHADOW_MAX_AGE
+        for offset, value in enumerate(values):
+            entry = self._shadow.get((slave_id, address + offset))
+            if entry is None or entry[0] != value or entry[1] < oldest:
+                return False
+        return True
 
-            return result.registers
+    def _forget_shadow(self, slave_id, address, count) -> None:
+        """Drop written registers from the shadow until the next read confirms them."""
+        for reg in range(address, address + count):
+            self._shadow.pop((slave_id, reg), None)
 
-        operation_name = f"Read registers {hex(address)}"
-        return self._retry_operation(_read_operation, operation_name)
-    
-    def write_register(self, address, value):
+    def write_register(self, address, value, slave_id=None):
         """Write a single register to the device with retry logic."""
-        def _write_operation():
-            if self._is_closing:
-                raise ConnectionException("Client is being closed")
+        slave_id = self._device(slave_id)
+        if not self._on_worker():
+            self._forget_overlapping_reads(slave_id, address, 1)
+            return bool(self._run_on_worker(self.write_register, address, value, slave_id))
 
-            with self._lock:
-                if self._is_closing:
-                    raise ConnectionException("Client is being closed")
-                    
-                if not self.client or not self.client.connected:
-                    if not self.connect():
-                        raise ConnectionException(
-                            f"Failed to establish connection to {self.host}:{self.port}"
-                        )
-                
-                client_ref = self.client
+        if self._shadow_holds(slave_id, address, (value,)):
+            _LOGGER.debug("Skipping write to %#06x: register already holds %s", address, value)
+            return True
 
-            if not client_ref:
-                raise ConnectionException("Client not initialized after connection attempt")
-            
-            if not isinstance(self.slave_id, int):
-                raise ValueError(f"Invalid slave_id type: {type(self.slave_id)}. Expected int.")
+        result = self._retry_operation(
+            self._do_write_register, "Write register", slave_id, address, value
+        )
+        self._forget_shadow(slave_id, address, 1)
+        return result if result is not None else False
 
-            # Enforce protocol delay BEFORE write (includes extra delay if previous was write)
-            self._enforce_command_interval(is_write=True)
+    def _do_write_register(self, address, value, slave_id):
+        """One single-register write attempt; retried by write_register()."""
+        client_ref = self._connected_client()
 
-            result = client_ref.write_register(
-                address=address,
-                value=value,
-                device_id=self.slave_id
+        # Enforce protocol delay BEFORE write (includes extra delay if previous was write)
+        self._enforce_command_interval(is_write=True)
+
+        result = client_ref.write_register(
+            address=address,
+            value=value,
+            device_id=slave_id
+        )
+
+        if result.isError():
+            raise ModbusExceptionResponse(
+                f"Modbus error writing register {hex(address)}: {result}",
+                getattr(result, "exception_code", None),
             )
 
-            if result.isError():
-                raise ModbusException(f"Modbus error writing register {hex(address)}: {result}")
+        _LOGGER.debug("Successfully wrote %s to register %#06x", value, address)
+        return True
+    
+    def write_registers(self, address, values, slave_id=None):
+        """Write multiple registers to the device with retry logic and improved logging.
 
-            _LOGGER.debug(f"Successfully wrote {value} to register {hex(address)}")
+        values is snapshotted into a tuple before the write is queued, so the
+        caller may reuse or mutate its list as soon as this returns (or, for
+        async_write_registers, as soon as the call is made).
+        """
+        values = tuple(values)
+        if not values:
+            return True
+        slave_id = self._device(slave_id)
+        if not self._on_worker():
+            self._forget_overlapping_reads(slave_id, address, len(values))
+            return bool(self._run_on_worker(self.write_registers, address, values, slave_id))
+
+        # All or nothing: a multi-register write is never trimmed, since the
+        # span may be one value (e.g. a 32-bit high/low pair) that must not be
+        # written a word at a time.
+        if self._shadow_holds(slave_id, address, values):
+            _LOGGER.debug(
+                "Skipping write of %d registers at %#06x: values unchanged", len(values), address
+            )
             return True
 
-        operation_name = f"Write register {hex(address)}"
-        result = self._retry_operation(_write_operation, operation_name)
+        result = self._retry_operation(
+            self._do_write_registers, "Write registers", slave_id, address, values
+        )
+        self._forget_shadow(slave_id, address, len(values))
         return result if result is not None else False
-    
-    def write_registers(self, address, values):
-        """Write multiple registers to the device with retry logic and improved logging."""
-        def _write_operation():
-            if self._is_closing:
-                raise ConnectionException("Client is being closed")
-
-            with self._lock:
-                if self._is_closing:
-                    raise ConnectionException("Client is being closed")
-                    
-                if not self.client or not self.client.connected:
-                    if not self.connect():
-                        raise ConnectionException(
-                            f"Failed to establish connection to {self.host}:{self.port}"
-                        )
-                
-                client_ref = self.client
 
-            if not client_ref:
-                raise ConnectionException("Client not initialized after connection attempt")
-            
-            if not isinstance(self.slave_id, int):
-                raise ValueError(f"Invalid slave_id type: {type(self.slave_id)}. Expected int.")
+    def _do_write_registers(self, address, values, slave_id):
+        """One multi-register write attempt; retried by write_registers()."""
+        client_ref = self._connected_client()
 
-            # Enhanced logging for dispatch commands
-            if address == 0x0880:
-                _LOGGER.info(
-                    f"Writing dispatch command to {hex(address)}: "
-                    f"Para1={values[0]}, Para2={values[1]:04X}{values[2]:04X}, "
-                    f"Para4={values[5]}, Para5={values[6]}, Para6={values[7]:04X}{values[8]:04X}"
-                )
+        # Enforce protocol delay BEFORE write (includes extra delay if previous was write)
+        self._enforce_command_interval(is_write=True)
 
-            # Enforce protocol delay BEFORE write (includes extra delay if previous was write)
-            self._enforce_command_interval(is_write=True)
+        result = client_ref.write_registers(
+            address=address,
+            values=values,
+            device_id=slave_id
+        )
 
-            result = client_ref.write_registers(
-                address=address,
-                values=values,
-                device_id=self.slave_id
+        if result.isError():
+            raise ModbusExceptionResponse(
+                f"Modbus error writing registers {hex(address)}: {result}",
+                getattr(result, "exception_code", None),
             )
 
-            if result.isError():
-                raise ModbusException(f"Modbus error writing registers {hex(address)}: {result}")
-
-            _LOGGER.debug(f"Successfully wrote {len(values)} values starting at {hex(address)}")
-            
-            # CRITICAL: Small delay after dispatch writes to let inverter process
-            if address == 0x0880:
-                time.sleep(0.05)  # 50ms post-write settling
-                
-            return True
+        _LOGGER.debug("Successfully wrote %d values starting at %#06x", len(values), address)
+
+        if address == 0x0880:
+            # CRITICAL: Small delay after dispatch writes to let inverter process.
+            # Charged to the next command's protocol delay rather than slept
+            # here, so it only costs time when another command follows soon.
+            self._extra_next_delay = DISPATCH_POST_WRITE_DELAY
+
+            # Enhanced logging for dispatch commands — after the write so it
+            # never delays the command, formatted lazily by the logger
+            _LOGGER.info(
+                "Wrote dispatch command to %#06x: Para1=%s, Para2=%04X%04X, "
+                "Para4=%s, Para5=%s, Para6=%04X%04X",
+                address, values[0], values[1], values[2],
+                values[5], values[6], values[7], values[8],
+            )
 
-        operation_name = f"Write registers {hex(address)}"
-        result = self._retry_operation(_write_operation, operation_name)
-        return result if result is not None else False
+        return True
     
-    def write_schedule_registers(self, register_value_pairs: list[tuple[int, int]], control_flag: int = 0) -> bool:
+    def write_schedule_registers(
+        self, register_value_pairs: list[tuple[int, int]], control_flag: int = 0, slave_id=None
+    ) -> bool:
         """Write schedule registers using 4 contiguous block writes (Modbus FC 0x10),
         then write 0x084F (time period control flag) as a commit trigger.
 
@@ -395,8 +962,8 @@ class NeovoltModbusClient:
         the EMS uses this write to detect that schedule settings have changed
         and should be applied. Without it the EMS ignores the register writes.
 
-        _sequence_lock is held across all writes to prevent any concurrent
-        read from interleaving.
+        The whole sequence runs as one job on the Modbus worker, so no
+        concurrent read can interleave with it.
 
         Args:
             register_value_pairs: 16 (address, value) tuples.
@@ -404,6 +971,14 @@ class NeovoltModbusClient:
         Returns:
             True if all writes succeeded, False on any failure.
         """
+        if not self._on_worker():
+            self._forget_overlapping_reads(
+                self._device(slave_id), SCHEDULE_FIRST_REGISTER, SCHEDULE_REGISTER_COUNT
+            )
+            return bool(self._run_on_worker(
+                self.write_schedule_registers, register_value_pairs, control_flag, slave_id
+            ))
+
         reg_map = {addr: val for addr, val in register_value_pairs}
 
         groups = [
@@ -413,48 +988,49 @@ class NeovoltModbusClient:
             (0x085A, [reg_map[0x085A], reg_map[0x085B], reg_map[0x085C], reg_map[0x085D]]),
         ]
 
-        with self._sequence_lock:
-            _LOGGER.debug(
-                f"write_schedule_registers: writing 4 blocks + 0x084F commit "
-                f"(flag={control_flag})"
-            )
-            for start_addr, values in groups:
-                success = self.write_registers(start_addr, values)
-                if not success:
-                    _LOGGER.error(
-                        f"write_schedule_registers: block write failed at "
-                        f"{hex(start_addr)}, aborting sequence"
-                    )
-                    return False
-
-            # Write control flag last as commit trigger
-            success = self.write_register(0x084F, control_flag)
+        _LOGGER.debug(
+            "write_schedule_registers: writing 4 blocks + 0x084F commit (flag=%s)",
+            control_flag,
+        )
+        for start_addr, values in groups:
+            success = self.write_registers(start_addr, values, slave_id)
             if not success:
                 _LOGGER.error(
-                    f"write_schedule_registers: commit write to 0x084F failed"
+                    "write_schedule_registers: block write failed at %#06x, aborting sequence",
+                    start_addr,
                 )
                 return False
 
-            _LOGGER.debug(
-                f"write_schedule_registers: all 4 blocks + 0x084F commit written successfully"
-            )
-            return True
+        # Write control flag last as commit trigger
+        success = self.write_register(0x084F, control_flag, slave_id)
+        if not success:
+            _LOGGER.error("write_schedule_registers: commit write to 0x084F failed")
+            return False
+
+        _LOGGER.debug(
+            "write_schedule_registers: all 4 blocks + 0x084F commit written successfully"
+        )
+        return True
 
     def close(self):
         """Close the Modbus connection."""
+        # Flag first, outside the lock, so a retry backoff or protocol delay
+        # in progress on the worker wakes up and gives up straight away.
+        # Never cleared: the client is not reused after close().
+        self._closing_event.set()
         with self._lock:
-            self._is_closing = True
 
             if self.client:
                 try:
                     self.client.close()
-                    _LOGGER.info(f"Closed connection to {self.host}:{self.port}")
+                    _LOGGER.info("Closed connection to %s:%s", self.host, self.port)
                 except Exception as e:
-                    _LOGGER.debug(f"Error closing connection (ignored): {e}")
+                    _LOGGER.debug("Error closing connection (ignored): %s", e)
                 finally:
                     self.client = None
 
-            self._is_closing = False
+        # The client is not reused after close() — release the worker thread.
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     @property
     def is_connected(self) -> bool:
@@ -462,22 +1038,151 @@ class NeovoltModbusClient:
         with self._lock:
             return self.client is not None and self.client.connected
 
-    def force_reconnect(self) -> bool:
-        """Force close and reconnect the Modbus connection."""
-        _LOGGER.info(f"Force reconnecting to {self.host}:{self.port}")
+    def _user_count(self) -> int:
+        """Number of devices currently sharing this client (1 if unshared)."""
+        with NeovoltModbusClient._shared_lock:
+            entry = NeovoltModbusClient._shared.get((self.host, self.port))
+            return entry[1] if entry is not None and entry[0] is self else 1
 
-        with self._lock:
-            self._is_closing = True
+    def force_reconnect(self, slave_id=None) -> bool:
+        """Recover slave_id: reset its failure state and reopen the connection.
 
-            if self.client:
-                try:
-                    self.client.close()
-                except Exception as e:
-                    _LOGGER.debug(f"Error closing client during force reconnect: {e}")
-                self.client = None
+        Scoped to the calling slave: only its circuit breaker is reset, and a
+        connection shared with other slaves is only reopened when the socket
+        itself is suspect — one inverter's recovery must not drop a healthy
+        socket out from under the others. Never undoes a close().
+        """
+        slave_id = self._device(slave_id)
+        if not self._on_worker():
+            return bool(self._run_on_worker(self.force_reconnect, slave_id))
+
+        with self._lock:
+            if self._closing_event.is_set():
+                return False
 
+            # An explicit reconnect (auto-recovery) gives this slave a fresh chance
+            self._breaker_failures.pop(slave_id, None)
+            self._breaker_open_until.pop(slave_id, None)
             self._last_error = None
             self._consecutive_errors = 0
-            self._is_closing = False
 
-        return self.connect()
\ No newline at end of file
+            socket_ok = (
+                not self._needs_reconnect and self.client is not None and self.client.connected
+            )
+            if socket_ok and self._user_count() > 1:
+                _LOGGER.info(
+                    "Reset slave %s on %s:%s; shared connection is healthy, left open",
+                    slave_id, self.host, self.port,
+                )
+                return True
+
+            # Runs on the worker, so no other command is mid-flight on the
+            # socket connect() replaces
+            _LOGGER.info("Force reconnecting to %s:%s", self.host, self.port)
+            return self.connect()
+
+
+class NeovoltModbusDevice:
+    """One inverter (slave ID) on a NeovoltModbusClient shared per (host, port).
+
+    Exposes the client API with this device's slave ID bound, so the
+    coordinator and entities use it exactly like a dedicated client while
+    the socket, worker thread and protocol timing are shared with any other
+    slave behind the same gateway. Obtain via NeovoltModbusClient.acquire().
+    """
+
+    def __init__(self, client: NeovoltModbusClient, slave_id: int):
+        """Bind slave_id to the shared client."""
+        if not isinstance(slave_id, int):
+            raise ValueError(f"Invalid slave_id type: {type(slave_id)}. Expected int.")
+        self._shared_client = client
+        self.host = client.host
+        self.port = client.port
+        self.slave_id = slave_id
+        self._released = False
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Single-thread executor reserved for the shared connection's Modbus I/O."""
+        return self._shared_client.executor
+
+    def async_run(self, func, *args) -> asyncio.Future:
+        """Run blocking Modbus work on the shared connection's worker."""
+        return self._shared_client.async_run(func, *args)
+
+    def async_force_reconnect(self) -> asyncio.Future:
+        """Awaitable force_reconnect() for this device."""
+        return self._shared_client.async_force_reconnect(self.slave_id)
+
+    def async_read_holding_registers(self, address, count) -> asyncio.Future:
+        """Awaitable read_holding_registers()."""
+        return self._shared_client.async_read_holding_registers(address, count, self.slave_id)
+
+    async def async_batch_read(self, specs: list[tuple[int, int]]) -> dict[int, list[int]]:
+        """Awaitable interruptible batch_read() for this device."""
+        return await self._shared_client.async_batch_read(specs, self.slave_id)
+
+    def async_write_register(self, address, value) -> asyncio.Future:
+        """Awaitable write_register()."""
+        return self._shared_client.async_write_register(address, value, self.slave_id)
+
+    def async_write_registers(self, address, values) -> asyncio.Future:
+        """Awaitable write_registers()."""
+        return self._shared_client.async_write_registers(address, values, self.slave_id)
+
+    def async_write_schedule_registers(
+        self, register_value_pairs: list[tuple[int, int]], control_flag: int = 0
+    ) -> asyncio.Future:
+        """Awaitable write_schedule_registers()."""
+        return self._shared_client.async_write_schedule_registers(
+            register_value_pairs, control_flag, self.slave_id
+        )
+
+    def test_connection(self):
+        """Test connection by reading this device's Battery SOC register."""
+        return self._shared_client.test_connection(self.slave_id)
+
+    def read_holding_registers(self, address, count):
+        """Read holding registers from this device."""
+        return self._shared_client.read_holding_registers(address, count, self.slave_id)
+
+    def batch_read(self, specs: list[tuple[int, int]]) -> dict[int, list[int]]:
+        """Coalesced multi-range read from this device (see NeovoltModbusClient)."""
+        return self._shared_client.batch_read(specs, self.slave_id)
+
+    def write_register(self, address, value):
+        """Write a single register on this device."""
+        return self._shared_client.write_register(address, value, self.slave_id)
+
+    def write_registers(self, address, values):
+        """Write multiple registers on this device."""
+        return self._shared_client.write_registers(address, values, self.slave_id)
+
+    def write_schedule_registers(
+        self, register_value_pairs: list[tuple[int, int]], control_flag: int = 0
+    ) -> bool:
+        """Write and commit this device's charge/discharge schedule."""
+        return self._shared_client.write_schedule_registers(
+            register_value_pairs, control_flag, self.slave_id
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the shared connection is currently connected."""
+        return self._shared_client.is_connected
+
+    @property
+    def circuit_open(self) -> bool:
+        """True while this device's circuit breaker is failing operations fast."""
+        return self._shared_client.is_circuit_open(self.slave_id)
+
+    def force_reconnect(self) -> bool:
+        """Recover this device (see NeovoltModbusClient.force_reconnect)."""
+        return self._shared_client.force_reconnect(self.slave_id)
+
+    def close(self):
+        """Release this device; the connection closes with its last device."""
+        if self._released:
+            return
+        self._released = True
+        self._shared_client.release()
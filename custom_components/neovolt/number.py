@@ -1,7 +1,9 @@
 """Number platform for Neovolt Solar Inverter."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import struct
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
@@ -27,10 +29,18 @@ from .const import (
     DEVICE_ROLE_FOLLOWER,
     GRID_POWER_OFFSET_MIN,
     GRID_POWER_OFFSET_MAX,
+    NUMBER_WRITE_DEBOUNCE_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# 32-bit value -> (high word, low word), big-endian as the inverter expects
+_PACK_U32 = struct.Struct(">I").pack
+_UNPACK_WORDS = struct.Struct(">HH").unpack
+# Signed 16-bit value -> its two's-complement register word
+_PACK_I16 = struct.Struct(">h").pack
+_UNPACK_U16 = struct.Struct(">H").unpack
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -207,6 +217,18 @@ class NeovoltNumber(CoordinatorEntity, NumberEntity):
         if icon:
             self._attr_icon = icon
 
+        # Config-driven max is recomputed only when the entry's data mapping is
+        # replaced (async_update_entry swaps in a new object on every change)
+        self._max_source = None
+
+        # Debounced Modbus write: only the latest value of a burst is sent
+        self._pending_value = None
+        self._pending_write: asyncio.Task | None = None
+        self._writing_task: asyncio.Task | None = None
+        # What the inverter last reported before this burst of writes; put
+        # back on screen if the write fails
+        self._value_before_write = None
+
         # Set default values for local settings
         if not write_to_modbus:
             self._local_value = default_value if default_value is not None else min_val
@@ -228,7 +250,12 @@ class NeovoltNumber(CoordinatorEntity, NumberEntity):
             return self._attr_native_max_value
 
         # Update max value from config entry for power settings
-        if self._config_entry and self._key in ["dispatch_power", "pv_capacity"]:
+        if (
+            self._config_entry
+            and self._key in ("dispatch_power", "pv_capacity")
+            and self._config_entry.data is not self._max_source
+        ):
+            self._max_source = self._config_entry.data
             if self._key == "dispatch_power":
                 # Use the higher of charge/discharge max power
                 charge_max = self._config_entry.data.get(CONF_MAX_CHARGE_POWER, DEFAULT_MAX_CHARGE_POWER)
@@ -238,7 +265,7 @@ class NeovoltNumber(CoordinatorEntity, NumberEntity):
                 # pv_capacity is in Watts, config is in kW
                 new_max = self._config_entry.data.get(CONF_MAX_CHARGE_POWER, self._attr_native_max_value) * 1000
             if new_max != self._attr_native_max_value:
-                _LOGGER.debug(f"Updated max value for {self._key} to {new_max}")
+                _LOGGER.debug("Updated max value for %s to %s", self._key, new_max)
                 self._attr_native_max_value = new_max
         return self._attr_native_max_value
 
@@ -254,37 +281,108 @@ class NeovoltNumber(CoordinatorEntity, NumberEntity):
             # Return local value for force charge/discharge settings
             return getattr(self, '_local_value', self._attr_native_min_value)
 
+    async def _async_flush_write(self) -> None:
+        """Write the latest pending value to Modbus after the debounce window."""
+        await asyncio.sleep(NUMBER_WRITE_DEBOUNCE_SECONDS)
+        value = self._pending_value
+        self._writing_task = asyncio.current_task()
+        try:
+            if self._is_32bit:
+                # 32-bit write: convert to scaled value and split into high/low words
+                scaled_value = int(value * self._scale)
+                high_word, low_word = _UNPACK_WORDS(_PACK_U32(scaled_value & 0xFFFFFFFF))
+                # Formatted lazily: the hex addresses are only built if INFO
+                # is actually emitted
+                _LOGGER.info(
+                    "Writing %s (scaled: %s) to Modbus registers %#06x/%#06x for %s",
+                    value, scaled_value, self._address, self._address + 1, self._key,
+                )
+                success = await self._client.async_write_registers(
+                    self._address, [high_word, low_word]
+                )
+            else:
+                # Single register write — handle signed values for 16-bit registers
+                register_value = int(value)
+                if self._signed_write:
+                    register_value = _UNPACK_U16(_PACK_I16(register_value))[0]
+                _LOGGER.info(
+                    "Writing %s to Modbus register %#06x for %s", value, self._address, self._key
+                )
+                success = await self._client.async_write_register(self._address, register_value)
+            if success:
+                # A write queued behind this one reverts to this value if it fails
+                self._value_before_write = value
+                # No forced refresh: the optimistic value is already on
+                # screen, and a full poll for one register would cost a whole
+                # read cycle. The next scheduled poll confirms it.
+                return
+            _LOGGER.error("Failed to set %s: write was not acknowledged", self._key)
+        except Exception as e:
+            _LOGGER.error("Failed to set %s: %s", self._key, e)
+        finally:
+            self._writing_task = None
+
+        # The write failed: unless a newer value is already queued, take the
+        # optimistic value back off screen (so re-entering it is not skipped
+        # as "already set") and re-poll for the inverter's actual state. A key
+        # that was never polled has nothing to put back — writing None would
+        # show the entity as unknown — so it only gets the re-poll.
+        if self._pending_write is asyncio.current_task():
+            if self._value_before_write is not None:
+                self.coordinator.set_optimistic_value(self._key, self._value_before_write)
+                self.async_write_ha_state()
+            await self.coordinator.async_request_refresh()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a write that has not been sent yet."""
+        if self._pending_write is not None and self._pending_write is not self._writing_task:
+            self._pending_write.cancel()
+        await super().async_will_remove_from_hass()
+
     async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
+        """Set new value.
+
+        Modbus-backed values are written by a debounced background task, so the
+        service call returns before the write is sent and cannot report its
+        failure: that is logged, and the previous value is put back on screen.
+        """
         try:
             if self._write_to_modbus and self._address:
-                if self._is_32bit:
-                    # 32-bit write: convert to scaled value and split into high/low words
-                    scaled_value = int(value * self._scale)
-                    high_word = (scaled_value >> 16) & 0xFFFF
-                    low_word = scaled_value & 0xFFFF
-                    _LOGGER.info(
-                        f"Writing {value} (scaled: {scaled_value}) to Modbus registers "
-                        f"{hex(self._address)}/{hex(self._address + 1)} for {self._key}"
-                    )
-                    await self._hass.async_add_executor_job(
-                        self._client.write_registers, self._address, [high_word, low_word]
-                    )
-                else:
-                    # Single register write — handle signed values for 16-bit registers
-                    register_value = int(value)
-                    if self._signed_write and register_value < 0:
-                        register_value = register_value & 0xFFFF  # Two's complement for negative
-                    _LOGGER.info(f"Writing {value} to Modbus register {hex(self._address)} for {self._key}")
-                    await self._hass.async_add_executor_job(
-                        self._client.write_register, self._address, register_value
-                    )
-                # Optimistic update - show expected value immediately
+                # The UI re-sends the current value on reflow; with no write
+                # pending (which the value may be reverting) there is nothing
+                # to change on the inverter, so skip the write and refresh.
+                current = self.coordinator.data.get(self._key)
+                if (
+                    (self._pending_write is None or self._pending_write.done())
+                    and current is not None
+                    and abs(float(current) - float(value)) < self._attr_native_step / 2
+                ):
+                    _LOGGER.debug("%s already at %s, skipping write", self._key, value)
+                    return
+
+                if self._pending_write is None or self._pending_write.done():
+                    self._value_before_write = current
+
+                # Optimistic update - show expected value immediately. The
+                # Modbus write follows once the value has settled, so a slider
+                # drag costs one write instead of one per intermediate step.
+                self._pending_value = value
                 self.coordinator.set_optimistic_value(self._key, value)
-                await self.coordinator.async_request_refresh()
+                self.async_write_ha_state()
+                # A flush already on the wire is left to finish; the new one
+                # queues behind it and sends the latest value.
+                if (
+                    self._pending_write is not None
+                    and not self._pending_write.done()
+                    and self._pending_write is not self._writing_task
+                ):
+                    self._pending_write.cancel()
+                self._pending_write = self.hass.async_create_task(
+                    self._async_flush_write()
+                )
             else:
                 # Store locally for force charge/discharge settings
-                _LOGGER.debug(f"Setting local value for {self._key}: {value}")
+                _LOGGER.debug("Setting local value for %s: %s", self._key, value)
                 self._local_value = value
 
                 # Persist dispatch SOC targets so the SOC watcher survives HA reboots
@@ -297,4 +395,4 @@ class NeovoltNumber(CoordinatorEntity, NumberEntity):
 
                 self.async_write_ha_state()
         except Exception as e:
-            _LOGGER.error(f"Failed to set {self._key}: {e}")
\ No newline at end of file
+            _LOGGER.error("Failed to set %s: %s", self._key, e)
\ No newline at end of file
@@ -30,6 +30,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# States that mean "no usable value" — a frozenset gives an O(1) membership test.
+_UNAVAILABLE_STATES = frozenset(("unknown", "unavailable", "None", None))
+
+
+def state_to_float(entity, default: float) -> float:
+    """Parse a State object's value as float, or default if unusable."""
+    if entity is None:
+        return default
+
+    state = entity.state
+    if state in _UNAVAILABLE_STATES:
+        return default
+
+    # Only the conversion can raise — states.get() and .state do not.
+    try:
+        return float(state)
+    except (ValueError, TypeError):
+        return default
+
 
 def safe_get_entity_float(hass: HomeAssistant, entity_id: str, default: float) -> float:
     """
@@ -43,8 +62,9 @@ def safe_get_entity_float(hass: HomeAssistant, entity_id: str, default: float) -
     Returns:
         Float value from entity state, or default if unavailable/invalid
     """
-    value, _, _ = safe_get_entity_float_with_source(hass, entity_id, default)
-    return value
+    # Fast path: sensors call this on every coordinator update, so it skips
+    # the reason strings built by safe_get_entity_float_with_source().
+    return state_to_float(hass.states.get(entity_id), default)
 
 
 def safe_get_by_unique_id(
@@ -69,39 +89,34 @@ def safe_get_by_unique_id(
         - used_default: True if the default was substituted
         - reason: human-readable explanation of why the default was used (empty if not)
     """
-    try:
-        registry = async_get_entity_registry(hass)
-        entry = registry.async_get_entity_id("number", DOMAIN, unique_id)
-
-        if not entry:
-            reason = f"unique_id '{unique_id}' not found in entity registry"
-            _LOGGER.debug(f"{reason}, using default: {default}")
-            return default, True, reason
-
-        entity_id = entry
-        state = hass.states.get(entity_id)
+    # Registry and state-machine lookups do not raise; only float() can, so
+    # the common success path runs without any exception handling.
+    registry = async_get_entity_registry(hass)
+    entity_id = registry.async_get_entity_id("number", DOMAIN, unique_id)
+
+    if not entity_id:
+        reason = f"unique_id '{unique_id}' not found in entity registry"
+        _LOGGER.debug("%s, using default: %s", reason, default)
+        return default, True, reason
 
-        if not state:
-            reason = f"entity '{entity_id}' (unique_id='{unique_id}') not found in state machine"
-            _LOGGER.debug(f"{reason}, using default: {default}")
-            return default, True, reason
+    state = hass.states.get(entity_id)
 
-        if state.state in ("unknown", "unavailable", "None", None):
-            reason = f"entity '{entity_id}' (unique_id='{unique_id}') state is '{state.state}'"
-            _LOGGER.debug(f"{reason}, using default: {default}")
-            return default, True, reason
+    if not state:
+        reason = f"entity '{entity_id}' (unique_id='{unique_id}') not found in state machine"
+        _LOGGER.debug("%s, using default: %s", reason, default)
+        return default, True, reason
 
-        value = float(state.state)
-        return value, False, ""
+    if state.state in _UNAVAILABLE_STATES:
+        reason = f"entity '{entity_id}' (unique_id='{unique_id}') state is '{state.state}'"
+        _LOGGER.debug("%s, using default: %s", reason, default)
+        return default, True, reason
 
+    try:
+        return float(state.state), False, ""
     except (ValueError, TypeError) as e:
         reason = f"unique_id '{unique_id}' state could not be converted to float: {e}"
         _LOGGER.warning(f"{reason}. Using default: {default}")
         return default, True, reason
-    except Exception as e:
-        reason = f"unexpected error reading unique_id '{unique_id}': {e}"
-        _LOGGER.error(f"{reason}. Using default: {default}")
-        return default, True, reason
 
 
 def safe_get_entity_float_with_source(
@@ -126,30 +141,24 @@ def safe_get_entity_float_with_source(
         - used_default: True if the default was substituted
         - reason: human-readable explanation of why the default was used (empty if not)
     """
-    try:
-        entity = hass.states.get(entity_id)
-        if not entity:
-            reason = f"entity '{entity_id}' not found in state machine"
-            _LOGGER.debug(f"{reason}, using default: {default}")
-            return default, True, reason
-
-        state = entity.state
-        if state in ("unknown", "unavailable", "None", None):
-            reason = f"entity '{entity_id}' state is '{state}'"
-            _LOGGER.debug(f"{reason}, using default: {default}")
-            return default, True, reason
+    entity = hass.states.get(entity_id)
+    if not entity:
+        reason = f"entity '{entity_id}' not found in state machine"
+        _LOGGER.debug("%s, using default: %s", reason, default)
+        return default, True, reason
 
-        value = float(state)
-        return value, False, ""
+    state = entity.state
+    if state in _UNAVAILABLE_STATES:
+        reason = f"entity '{entity_id}' state is '{state}'"
+        _LOGGER.debug("%s, using default: %s", reason, default)
+        return default, True, reason
 
+    try:
+        return float(state), False, ""
     except (ValueError, TypeError) as e:
         reason = f"entity '{entity_id}' state could not be converted to float: {e}"
         _LOGGER.warning(f"{reason}. Using default: {default}")
         return default, True, reason
-    except Exception as e:
-        reason = f"unexpected error reading entity '{entity_id}': {e}"
-        _LOGGER.error(f"{reason}. Using default: {default}")
-        return default, True, reason
 
 
 def soc_percent_to_register(soc_percent: float) -> int:
@@ -331,12 +340,12 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
         await self._stop_all_dynamic_managers()
 
         _LOGGER.info("Stopping dispatch, returning to Normal mode")
-        await self._hass.async_add_executor_job(
-            self._client.write_registers, 0x0880, DISPATCH_RESET_VALUES
-        )
-        self.coordinator.set_optimistic_value("dispatch_start", 0)
-        self.coordinator.set_optimistic_value("dispatch_power", 0)
-        self.coordinator.set_optimistic_value("dispatch_mode", 0)
+        await self._client.async_write_registers(0x0880, DISPATCH_RESET_VALUES)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 0,
+            "dispatch_power": 0,
+            "dispatch_mode": 0,
+        })
         self.coordinator.soc_watcher_disarm()
         await self.coordinator.async_request_refresh()
 
@@ -419,12 +428,12 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             f"(duration: {duration}min)"
         )
 
-        await self._hass.async_add_executor_job(
-            self._client.write_registers, 0x0880, values
-        )
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_power", -power_watts)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_POWER_WITH_SOC)
+        await self._client.async_write_registers(0x0880, values)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_power": -power_watts,
+            "dispatch_mode": DISPATCH_MODE_POWER_WITH_SOC,
+        })
         # Persist the charge target and arm the SOC watcher
         self.coordinator._dispatch_charge_soc = float(soc_target)
         self.coordinator._save_persistent_data()
@@ -509,12 +518,12 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             f"(duration: {duration}min)"
         )
 
-        await self._hass.async_add_executor_job(
-            self._client.write_registers, 0x0880, values
-        )
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_power", power_watts)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_POWER_WITH_SOC)
+        await self._client.async_write_registers(0x0880, values)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_power": power_watts,
+            "dispatch_mode": DISPATCH_MODE_POWER_WITH_SOC,
+        })
         # Persist the discharge cutoff and arm the SOC watcher
         self.coordinator._dispatch_discharge_soc = float(soc_cutoff)
         self.coordinator._save_persistent_data()
@@ -550,8 +559,10 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             return
 
         # Set optimistic values for UI
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_EXPORT)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_mode": DISPATCH_MODE_DYNAMIC_EXPORT,
+        })
         # Arm the SOC watcher for discharge direction
         self.coordinator.soc_watcher_arm("discharge")
         await self.coordinator.async_request_refresh()
@@ -585,8 +596,10 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             return
 
         # Set optimistic values for UI
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_IMPORT)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_mode": DISPATCH_MODE_DYNAMIC_IMPORT,
+        })
         # Arm the SOC watcher for charge direction
         self.coordinator.soc_watcher_arm("charge")
         await self.coordinator.async_request_refresh()
@@ -635,8 +648,10 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             _LOGGER.error(f"Failed to start Dynamic SOC Export manager: {e}", exc_info=True)
             return
 
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_DYNAMIC_SOC_EXPORT)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_mode": DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
+        })
         # Arm the SOC watcher for discharge direction — enforces the hard cutoff
         # floor regardless of whether the manager itself is still running.
         self.coordinator.soc_watcher_arm("discharge")
@@ -675,12 +690,12 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
 
         _LOGGER.info(f"Enabling No Battery Charge mode for {duration} minutes")
 
-        await self._hass.async_add_executor_job(
-            self._client.write_registers, 0x0880, values
-        )
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_power", 0)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_NO_CHARGE)
+        await self._client.async_write_registers(0x0880, values)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_power": 0,
+            "dispatch_mode": DISPATCH_MODE_NO_CHARGE,
+        })
         await self.coordinator.async_request_refresh()
 
     async def _start_no_battery_discharge(self):
@@ -736,14 +751,14 @@ class NeovoltDispatchModeSelect(CoordinatorEntity, SelectEntity):
             f"(hardware: Mode 2, power=0W / Para2={MODBUS_OFFSET})"
         )
 
-        await self._hass.async_add_executor_job(
-            self._client.write_registers, 0x0880, values
-        )
+        await self._client.async_write_registers(0x0880, values)
         # Use internal tracking constant so current_option can identify this mode
         # even though the hardware reports Mode 2 (same as Force Charge/Discharge)
-        self.coordinator.set_optimistic_value("dispatch_start", 1)
-        self.coordinator.set_optimistic_value("dispatch_power", 0)
-        self.coordinator.set_optimistic_value("dispatch_mode", DISPATCH_MODE_NO_DISCHARGE)
+        self.coordinator.set_optimistic_values({
+            "dispatch_start": 1,
+            "dispatch_power": 0,
+            "dispatch_mode": DISPATCH_MODE_NO_DISCHARGE,
+        })
         await self.coordinator.async_request_refresh()
 
 
@@ -822,9 +837,7 @@ class NeovoltPVSwitchSelect(CoordinatorEntity, SelectEntity):
 
             _LOGGER.info(f"Setting PV switch to: {option} (value: {new_value})")
 
-            await self._hass.async_add_executor_job(
-                self._client.write_registers, 0x0880, values
-            )
+            await self._client.async_write_registers(0x0880, values)
             self.coordinator.set_optimistic_value("dispatch_pv_switch", new_value)
             await self.coordinator.async_request_refresh()
 
@@ -46,7 +46,12 @@ from .const import (
     INVERTER_FAULT_BITS,
     INVERTER_FAULT_EXT_BITS,
     SYSTEM_FAULT_BITS,
+    DISPATCH_MODE_DYNAMIC_EXPORT,
+    DISPATCH_MODE_DYNAMIC_IMPORT,
+    DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
+    DISPATCH_MODE_NO_DISCHARGE,
 )
+from .select import safe_get_entity_float
 
 
 async def async_setup_entry(
@@ -603,13 +608,6 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> str:
         """Return human-readable dispatch status."""
-        from .const import (
-            DISPATCH_MODE_DYNAMIC_EXPORT,
-            DISPATCH_MODE_DYNAMIC_IMPORT,
-            DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
-            DISPATCH_MODE_NO_DISCHARGE,
-        )
-
         data = self.coordinator.data
         dispatch_start = data.get("dispatch_start", 0)
 
@@ -630,7 +628,6 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
 
             # Try to get target export value
             try:
-                from .select import safe_get_entity_float
                 target = safe_get_entity_float(
                     self.hass,
                     f"number.neovolt_{self._device_name}_dynamic_mode_power_target",
@@ -645,15 +642,13 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
             # For Dynamic Export, get time remaining from the manager
             if hasattr(self.coordinator, 'dynamic_export_manager'):
                 manager = self.coordinator.dynamic_export_manager
-                if manager.is_running and manager._start_time and manager._duration_minutes:
-                    elapsed_minutes = (dt_util.now() - manager._start_time).total_seconds() / 60.0
-                    remaining_minutes = max(0, manager._duration_minutes - elapsed_minutes)
-                    dispatch_time = int(remaining_minutes * 60)  # Convert to seconds
+                remaining_s = manager.remaining_seconds
+                if remaining_s is not None:
+                    dispatch_time = int(remaining_s)
 
         elif dispatch_mode == DISPATCH_MODE_DYNAMIC_IMPORT:
             # Get target import value
             try:
-                from .select import safe_get_entity_float
                 target = safe_get_entity_float(
                     self.hass,
                     f"number.neovolt_{self._device_name}_dynamic_mode_power_target",
@@ -668,14 +663,12 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
             # Get time remaining from the import manager
             if hasattr(self.coordinator, 'dynamic_import_manager'):
                 manager = self.coordinator.dynamic_import_manager
-                if manager.is_running and manager._start_time and manager._duration_minutes:
-                    elapsed_minutes = (dt_util.now() - manager._start_time).total_seconds() / 60.0
-                    remaining_minutes = max(0, manager._duration_minutes - elapsed_minutes)
-                    dispatch_time = int(remaining_minutes * 60)  # Convert to seconds
+                remaining_s = manager.remaining_seconds
+                if remaining_s is not None:
+                    dispatch_time = int(remaining_s)
 
         elif dispatch_mode == DISPATCH_MODE_DYNAMIC_SOC_EXPORT:
             try:
-                from .select import safe_get_entity_float
                 target_soc = safe_get_entity_float(
                     self.hass,
                     f"number.neovolt_{self._device_name}_dispatch_discharge_target_soc",
@@ -689,10 +682,9 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
 
             if hasattr(self.coordinator, 'dynamic_soc_export_manager'):
                 manager = self.coordinator.dynamic_soc_export_manager
-                if manager.is_running and manager._start_time and manager._duration_minutes:
-                    elapsed_minutes = (dt_util.now() - manager._start_time).total_seconds() / 60.0
-                    remaining_minutes = max(0, manager._duration_minutes - elapsed_minutes)
-                    dispatch_time = int(remaining_minutes * 60)
+                remaining_s = manager.remaining_seconds
+                if remaining_s is not None:
+                    dispatch_time = int(remaining_s)
 
         elif dispatch_mode == 1:
             mode = "Battery PV Only"
@@ -743,12 +735,6 @@ class NeovoltDispatchStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return detailed dispatch state as attributes."""
-        from .const import (
-            DISPATCH_MODE_DYNAMIC_EXPORT,
-            DISPATCH_MODE_DYNAMIC_IMPORT,
-            DISPATCH_MODE_DYNAMIC_SOC_EXPORT,
-        )
-
         data = self.coordinator.data
         attrs = {
             "dispatch_active": data.get("dispatch_start", 0) == 1,
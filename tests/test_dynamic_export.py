@@ -0,0 +1,146 @@
+"""Tests for the Dynamic Export / Import dispatch control loops."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.neovolt.const import (  # noqa: E402
+    DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD,
+    DYNAMIC_EXPORT_REWRITE_SECONDS,
+    MODBUS_OFFSET,
+)
+from custom_components.neovolt.dynamic_export import (  # noqa: E402
+    DynamicExportManager,
+    DynamicImportManager,
+    _is_redundant_command,
+)
+
+# Para2 low word of the 11-register dispatch frame: 32000 + W discharges,
+# 32000 - W charges.
+PARA2 = 2
+# "Dynamic Mode Power Target" seen by both managers, in kW
+TARGET_KW = 1.0
+
+
+class FakeClient:
+    """Records dispatch frames; every write reports self.ok."""
+
+    def __init__(self, ok=True):
+        self.ok = ok
+        self.frames = []
+
+    async def async_write_registers(self, address, values):
+        self.frames.append(tuple(values))
+        return self.ok
+
+
+class FakeCoordinator:
+    """Host-only coordinator holding a single grid reading."""
+
+    def __init__(self, grid_power_w):
+        self.config_entry = SimpleNamespace(data={})
+        self.data = {"grid_power_total": grid_power_w}
+        self.follower_coordinator = None
+        self.polling_manager = SimpleNamespace(
+            pin_block_interval=lambda block, interval: None
+        )
+        self.optimistic = {}
+
+    def set_optimistic_values(self, values):
+        self.optimistic.update(values)
+
+
+def _running_manager(cls, grid_power_w, client):
+    """Build a manager in its running state without starting the loop task."""
+    hass = SimpleNamespace(
+        loop=asyncio.get_running_loop(),
+        states=SimpleNamespace(get=lambda entity_id: None),
+    )
+    manager = cls(hass, FakeCoordinator(grid_power_w), client, "test")
+    manager._get_number = lambda unique_id, default: TARGET_KW
+    manager._running = True
+    return manager
+
+
+@pytest.mark.parametrize(
+    ("new_kw", "last_kw", "age_s", "redundant"),
+    [
+        # Same direction, within the threshold, recently sent
+        (1.0 + DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD / 2, 1.0, 30.0, True),
+        (0.0, 0.0, 30.0, True),
+        # A change of at least the threshold is always sent
+        (1.0 + DYNAMIC_EXPORT_DEBOUNCE_THRESHOLD, 1.0, 30.0, False),
+        # A direction change is always sent, however small
+        (0.01, -0.01, 30.0, False),
+        (0.0, 0.01, 30.0, False),
+        # Periodic refresh once the last command is old enough
+        (1.0, 1.0, DYNAMIC_EXPORT_REWRITE_SECONDS, False),
+    ],
+)
+def test_is_redundant_command(new_kw, last_kw, age_s, redundant):
+    assert _is_redundant_command("Test", new_kw, last_kw, age_s) is redundant
+
+
+@pytest.mark.parametrize(
+    ("cls", "grid_power_w", "battery_w"),
+    [
+        # Importing 2 kW against a 1 kW export target: discharge one step
+        (DynamicExportManager, 2000, 1000),
+        # Exporting 3 kW against a 1 kW export target: charge one step
+        (DynamicExportManager, -3000, -1000),
+        # Exporting 3 kW against a 1 kW import target: charge one step
+        (DynamicImportManager, -3000, -1000),
+        # Importing 3 kW against a 1 kW import target: discharge one step
+        (DynamicImportManager, 3000, 1000),
+    ],
+)
+def test_dispatch_frame_sign(cls, grid_power_w, battery_w):
+    """Para2 and dispatch_power use the inverter sign: positive discharges."""
+    async def run():
+        client = FakeClient()
+        manager = _running_manager(cls, grid_power_w, client)
+        await manager._update_battery_power()
+        return client, manager._coordinator
+
+    client, coordinator = asyncio.run(run())
+
+    assert len(client.frames) == 1
+    assert client.frames[0][PARA2] == MODBUS_OFFSET + battery_w
+    assert coordinator.optimistic["dispatch_power"] == battery_w
+
+
+@pytest.mark.parametrize("cls", [DynamicExportManager, DynamicImportManager])
+def test_failed_write_is_retried_next_cycle(cls):
+    """A dispatch write that failed must not be debounced as already sent."""
+    async def run():
+        client = FakeClient(ok=False)
+        manager = _running_manager(cls, 2000, client)
+        await manager._update_battery_power()
+        client.ok = True
+        await manager._update_battery_power()
+        return client, manager
+
+    client, manager = asyncio.run(run())
+
+    assert len(client.frames) == 2
+    assert client.frames[0] == client.frames[1]
+    assert manager._last_inputs is not None
+
+
+def test_identical_frame_is_written_once():
+    """_write_dispatch skips a frame the inverter already holds, not a failed one."""
+    async def run():
+        client = FakeClient(ok=False)
+        manager = _running_manager(DynamicExportManager, 0, client)
+        frame = list(range(11))
+        assert not await manager._write_dispatch(frame)
+        client.ok = True
+        assert await manager._write_dispatch(frame)
+        assert await manager._write_dispatch(frame)
+        return client
+
+    client = asyncio.run(run())
+
+    assert len(client.frames) == 2
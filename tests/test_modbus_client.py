@@ -0,0 +1,43 @@
+"""Tests for NeovoltModbusClient error classification and retry handling."""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from pymodbus.exceptions import ModbusIOException  # noqa: E402
+
+# Loaded by path: importing the package would pull in Home Assistant, which
+# modbus_client itself does not need.
+_SPEC = importlib.util.spec_from_file_location(
+    "neovolt_modbus_client",
+    Path(__file__).parent.parent / "custom_components" / "neovolt" / "modbus_client.py",
+)
+modbus_client = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(modbus_client)
+
+# Raised verbatim by pymodbus' transaction manager when a request times out
+# with retries=0, as configured in NeovoltModbusClient.connect()
+NO_RESPONSE = ModbusIOException(
+    "No response received after 0 retries, continue with next request"
+)
+
+
+def test_no_response_is_transient():
+    assert modbus_client.NeovoltModbusClient._is_transient_error(NO_RESPONSE)
+
+
+def test_no_response_counts_toward_circuit_breaker():
+    client = modbus_client.NeovoltModbusClient("192.0.2.1", 502, 1)
+    try:
+        def timed_out(address, slave_id):
+            raise NO_RESPONSE
+
+        result = client._retry_operation(timed_out, "Read registers", 1, 0x0102)
+
+        assert result is None
+        assert client._breaker_failures.get(1) == 1
+        assert client._needs_reconnect
+    finally:
+        client.close()
@@ -0,0 +1,88 @@
+"""Tests for the debounced NeovoltNumber Modbus write."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.neovolt import number  # noqa: E402
+
+KEY = "charging_cutoff_soc"
+
+
+class FakeClient:
+    """Single-register writes that all report self.ok."""
+
+    def __init__(self, ok):
+        self.ok = ok
+        self.writes = []
+
+    async def async_write_register(self, address, value):
+        self.writes.append((address, value))
+        return self.ok
+
+
+class FakeCoordinator:
+    """Coordinator data plus a record of optimistic updates and refreshes."""
+
+    has_valid_data = True
+
+    def __init__(self, data):
+        self.data = data
+        self.optimistic = []
+        self.refreshes = 0
+
+    def set_optimistic_value(self, key, value):
+        self.optimistic.append((key, value))
+        self.data[key] = value
+
+    async def async_request_refresh(self):
+        self.refreshes += 1
+
+    def async_add_listener(self, update_callback, context=None):
+        return lambda: None
+
+
+def _set_value(monkeypatch, data, ok, value=90):
+    """Set the entity to value and wait for its debounced write to finish."""
+    monkeypatch.setattr(number, "NUMBER_WRITE_DEBOUNCE_SECONDS", 0)
+
+    async def run():
+        coordinator = FakeCoordinator(data)
+        client = FakeClient(ok)
+        entity = number.NeovoltNumber(
+            coordinator, None, "test", client, None, KEY, "Charging Cutoff SOC",
+            10, 100, 1, "%", address=0x0855,
+        )
+        entity.hass = SimpleNamespace(async_create_task=asyncio.ensure_future)
+        entity.async_write_ha_state = lambda: None
+        await entity.async_set_native_value(value)
+        await entity._pending_write
+        return coordinator, client
+
+    return asyncio.run(run())
+
+
+def test_successful_write_keeps_value(monkeypatch):
+    coordinator, client = _set_value(monkeypatch, {KEY: 80}, ok=True)
+
+    assert client.writes == [(0x0855, 90)]
+    assert coordinator.data[KEY] == 90
+    assert coordinator.refreshes == 0
+
+
+def test_failed_write_reverts_and_refreshes(monkeypatch):
+    coordinator, client = _set_value(monkeypatch, {KEY: 80}, ok=False)
+
+    assert client.writes == [(0x0855, 90)]
+    assert coordinator.data[KEY] == 80
+    assert coordinator.refreshes == 1
+
+
+def test_failed_write_of_unpolled_key_only_refreshes(monkeypatch):
+    coordinator, client = _set_value(monkeypatch, {}, ok=False)
+
+    assert (KEY, None) not in coordinator.optimistic
+    assert coordinator.data[KEY] == 90
+    assert coordinator.refreshes == 1